@@ -1,38 +1,93 @@
 # rendering/animation.py
 import math
-import threading
+import os
 import time
-from PIL import Image, ImageTk
+import numpy as np
 import pygame
-from pygame.locals import *
-from OpenGL.GL import *
-from OpenGL.GLU import *
-from simulation.constants import G, LENGTH_SWING, LBS_TO_KG, ANTHROPOMETRIC_DATA, PLATFORM_WIDTH
+from pygame.locals import DOUBLEBUF, OPENGL, HIDDEN
+from OpenGL.GL import (
+    GL_ALL_ATTRIB_BITS, GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, GL_LEQUAL, GL_MODELVIEW,
+    GL_PACK_ALIGNMENT, GL_PROJECTION, GL_RGB, GL_UNSIGNED_BYTE,
+    glClear, glClearColor, glDeleteTextures, glDepthFunc, glEnable, glFinish, glLoadIdentity, glMatrixMode,
+    glPixelStorei, glPopAttrib, glPopMatrix, glPushAttrib, glPushMatrix, glReadPixels, glViewport
+)
+from OpenGL.GLU import gluOrtho2D
+from simulation.constants import G, LENGTH_SWING, LBS_TO_KG
 from simulation.calculations import (
-    calculate_max_angle, check_platform_collision, calculate_force,
-    calculate_impact_surface, calculate_pressure, calculate_acceleration,
-    calculate_collision
+    check_platform_collision, calculate_collision, assess_impact,
+    calculate_kinetic_energy, calculate_potential_energy
 )
-from simulation.risk_assessment import (
-    assess_decapitation_risk, assess_cervical_fracture_risk, assess_concussion_risk
+from simulation.batch import SwingBatch
+from .resolution import DynamicResolution
+from .layout import MAX_COMPARISON_TILES, comparison_grid
+from .opengl_utils import (
+    load_texture, clear_font_cache, set_render_size, draw_background, draw_swing, draw_pivot, draw_grid,
+    render_fps, render_text
 )
-from .opengl_utils import load_texture, draw_swing, draw_pivot, draw_grid, render_fps, render_text
-
-
-def animate_swings_thread(surface, animation_label, root, toggle_button, is_running, update_results,
-                         max_angle, age, mass1_lbs, mass2_lbs, v_init1, v_init2,
-                         max_height, impact_type):
-    pygame.init()  # Ensure Pygame is initialized
-    window_width, window_height = 800, 600
-    pygame.display.set_mode((window_width, window_height), DOUBLEBUF | OPENGL | HIDDEN)
-    gluOrtho2D(-5 , 5 , -2 , 5 )
-    glClearColor(0.0, 1.0, 0.0, 1.0)
-    glEnable(GL_DEPTH_TEST)
-    glDepthFunc(GL_LEQUAL)
-    background_texture = load_texture("animation/background.jpg")
-    if background_texture is None:
-        print("Failed to load background texture; rendering with fallback color.")
-    clock = pygame.time.Clock()
+
+
+# Les échantillons des courbes sont regroupés par paquets pour limiter les événements
+PLOT_SAMPLE_BATCH = 6
+
+BACKGROUND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "background.jpg")
+
+
+class RenderContext:
+    """
+    Contexte pygame/OpenGL (fenêtre cachée, texture de fond, polices) conservé
+    d'une animation à l'autre. Il doit être créé, utilisé et fermé dans le même thread.
+
+    La fenêtre a la résolution d'affichage ; avec `dynamic_resolution`, le rendu
+    se fait dans un viewport réduit choisi par `self.resolution` pour tenir
+    `target_frame_time`, et l'image est agrandie à l'affichage.
+    """
+
+    def __init__(self, window_width=800, window_height=600, dynamic_resolution=False,
+                 target_frame_time=1.0 / 60.0):
+        pygame.init()
+        self.window_width = window_width
+        self.window_height = window_height
+        pygame.display.set_mode((window_width, window_height), DOUBLEBUF | OPENGL | HIDDEN)
+        gluOrtho2D(-5 , 5 , -2 , 5 )
+        glClearColor(0.0, 1.0, 0.0, 1.0)
+        glEnable(GL_DEPTH_TEST)
+        glDepthFunc(GL_LEQUAL)
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        self.background_texture = load_texture(BACKGROUND_PATH, (window_width, window_height))
+        if self.background_texture is None:
+            print("Failed to load background texture; rendering with fallback color.")
+        self.clock = pygame.time.Clock()
+        self.resolution = DynamicResolution(window_width, window_height, target_frame_time,
+                                            enabled=dynamic_resolution)
+
+    def close(self):
+        if self.background_texture:
+            try:
+                glDeleteTextures([self.background_texture])
+                print("Texture deleted")
+            except Exception as e:
+                print(f"Error deleting texture: {e}")
+            self.background_texture = None
+        clear_font_cache()
+        pygame.quit()  # Proper cleanup
+
+
+def animate_swings(context, frames, events, run,
+                   max_angle, age, mass1_lbs, mass2_lbs, v_init1, v_init2,
+                   max_height, impact_type):
+    """
+    Anime un scénario dans un contexte de rendu existant tant que `run` est
+    actif (voir render_worker.RenderRun).
+
+    Les images sont lues directement dans le tampon fourni par `frames`
+    (FrameMailbox ou SharedFrameRing) puis publiées ; les événements
+    ("results", "finished", et "samples" par paquets de PLOT_SAMPLE_BATCH lignes
+    (t, Ec, Ep, ω1, ω2, force) pour les courbes en direct) passent par la file
+    `events`. Cette fonction ne
+    touche jamais à Tk et peut donc tourner dans un autre thread ou processus.
+    """
+    background_texture = context.background_texture
+    clock = context.clock
     pivot1_x = -2.0 
     pivot2_x = 2.0 
     pivot1_y = pivot2_y = LENGTH_SWING
@@ -56,8 +111,13 @@ def animate_swings_thread(surface, animation_label, root, toggle_button, is_runn
     
     final_v1 = 0
     final_v2 = 0
+    plot_samples = []
     
-    while is_running.get():
+    while run.is_active():
+        frame_start = time.perf_counter()
+        render_width, render_height = context.resolution.render_size
+        glViewport(0, 0, render_width, render_height)
+        set_render_size(render_width, render_height)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
         # Set up projection and modelview matrices each frame
@@ -71,28 +131,7 @@ def animate_swings_thread(surface, animation_label, root, toggle_button, is_runn
         glPushAttrib(GL_ALL_ATTRIB_BITS)
         glPushMatrix()
         
-        # Render background
-        if background_texture:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, background_texture)
-            glDisable(GL_DEPTH_TEST)
-            glBegin(GL_QUADS)
-            glTexCoord2f(0, 0); glVertex2f(-5 , -2 )
-            glTexCoord2f(1, 0); glVertex2f(5 , -2 )
-            glTexCoord2f(1, 1); glVertex2f(5 , 5 )
-            glTexCoord2f(0, 1); glVertex2f(-5 , 5 )
-            glEnd()
-            glDisable(GL_TEXTURE_2D)
-            glEnable(GL_DEPTH_TEST)
-        else:
-            # Fallback quad to prevent black background
-            glBegin(GL_QUADS)
-            glColor3f(0.0, 0.5, 0.0)  # Dark green
-            glVertex2f(-5 , -2 )
-            glVertex2f(5 , -2 )
-            glVertex2f(5 , 5 )
-            glVertex2f(-5 , 5 )
-            glEnd()
+        draw_background(background_texture)
         
         glPopMatrix()
         draw_grid()
@@ -103,7 +142,7 @@ def animate_swings_thread(surface, animation_label, root, toggle_button, is_runn
             fps = fps_count / elapsed_time
             fps_count = 0
             last_time = current_time
-        if is_running.get():
+        if run.is_active():
             accel1 = -(G / LENGTH_SWING) * math.sin(theta1) - (damping_coeff / mass1_kg) * theta1_dot
             accel2 = -(G / LENGTH_SWING) * math.sin(theta2) - (damping_coeff / mass2_kg) * theta2_dot
             theta1_dot += accel1 * dt
@@ -121,24 +160,9 @@ def animate_swings_thread(surface, animation_label, root, toggle_button, is_runn
                 v2 = theta2_dot * LENGTH_SWING
                 final_v1 = v1
                 final_v2 = v2
-                v1_prime, v2_prime = calculate_collision(theta1_dot, theta2_dot, mass1_kg, mass2_kg, e)
-                theta1_dot = v1_prime / LENGTH_SWING
-                theta2_dot = v2_prime / LENGTH_SWING
+                theta1_dot, theta2_dot = calculate_collision(theta1_dot, theta2_dot, mass1_kg, mass2_kg, e)
                 collision_occurred = True
                 flash_time = current_time
-                # Calculer le rapport
-                velocity1 = v1
-                velocity2 = v2
-                relative_velocity = abs(velocity1) + abs(velocity2)
-                reduced_mass = (mass1_kg * mass2_kg) / (mass1_kg + mass2_kg) if (mass1_kg + mass2_kg) != 0 else mass1_kg
-                force = calculate_force(relative_velocity, reduced_mass)
-                surface_cm2 = calculate_impact_surface(age, impact_type)
-                pressure_mpa = calculate_pressure(force, surface_cm2)
-                head_mass = ANTHROPOMETRIC_DATA[age]["head_mass_kg"]
-                acceleration_ms2 = calculate_acceleration(force, head_mass)
-                decapitation_risk = assess_decapitation_risk(pressure_mpa, age)
-                cervical_fracture_risk = assess_cervical_fracture_risk(pressure_mpa, age)
-                concussion_risk = assess_concussion_risk(acceleration_ms2, age)
                 results = {
                     "age": age,
                     "max_height": max_height,
@@ -151,17 +175,23 @@ def animate_swings_thread(surface, animation_label, root, toggle_button, is_runn
                     "angle_horizontal_1": math.degrees(theta1),
                     "angle_horizontal_2": math.degrees(theta2),
                     "impact_type": impact_type,
-                    "velocity1": velocity1,
-                    "velocity2": velocity2,
-                    "relative_velocity": relative_velocity,
-                    "force": force,
-                    "surface_cm2": surface_cm2,
-                    "pressure_mpa": pressure_mpa,
-                    "decapitation_risk": decapitation_risk.display_name,
-                    "cervical_fracture_risk": cervical_fracture_risk.display_name,
-                    "concussion_risk": concussion_risk.display_name
                 }
-                root.after(0, lambda: update_results(results))
+                results.update(assess_impact(v1, v2, mass1_kg, mass2_kg, age, impact_type))
+                events.put(("results", results))
+                impact_force = results["force"]
+            else:
+                impact_force = 0.0
+            plot_samples.append((
+                t,
+                calculate_kinetic_energy(theta1_dot, mass1_kg) + calculate_kinetic_energy(theta2_dot, mass2_kg),
+                calculate_potential_energy(theta1, mass1_kg) + calculate_potential_energy(theta2, mass2_kg),
+                theta1_dot,
+                theta2_dot,
+                impact_force
+            ))
+            if len(plot_samples) >= PLOT_SAMPLE_BATCH:
+                events.put(("samples", plot_samples))
+                plot_samples = []
             if collision_occurred and current_time - flash_time < 0.1:
                 color1 = (1, 0, 0) if impact_type == "frontal" else (1, 0.5, 0)
                 color2 = (1, 0, 0) if impact_type == "frontal" else (1, 0.5, 0)
@@ -169,8 +199,7 @@ def animate_swings_thread(surface, animation_label, root, toggle_button, is_runn
                 color1 = (0, 0, 1)
                 color2 = (1, 0, 0)
                 if collision_occurred:
-                    is_running.set(False)
-                    root.after(0, lambda: toggle_button.config(text="Démarrer", state="normal"))
+                    run.finish()
         else:
             theta1 = 0
             theta2 = 0
@@ -210,23 +239,107 @@ def animate_swings_thread(surface, animation_label, root, toggle_button, is_runn
         
         # Capture buffer
         glFinish()
-        data = glReadPixels(0, 0, window_width, window_height, GL_RGB, GL_UNSIGNED_BYTE)
-        if not data:
-            print("glReadPixels returned empty data")
-            continue
-        image = Image.frombytes("RGB", (window_width, window_height), data)
-        image = image.transpose(Image.FLIP_TOP_BOTTOM)
-        photo = ImageTk.PhotoImage(image)
-        root.after(0, lambda: animation_label.configure(image=photo))
-        root.after(0, lambda: setattr(animation_label, 'image', photo))
+        buffer = frames.frame_buffer(render_width, render_height)
+        glReadPixels(0, 0, render_width, render_height, GL_RGB, GL_UNSIGNED_BYTE, buffer)
+        frames.publish(buffer)
+        context.resolution.record(time.perf_counter() - frame_start)
         
         clock.tick(60)
-    
-    # Cleanup
-    if background_texture:
-        try:
-            glDeleteTextures([background_texture])
-            print("Texture deleted")
-        except Exception as e:
-            print(f"Error deleting texture: {e}")
-    pygame.quit()  # Proper cleanup
\ No newline at end of file
+
+    if plot_samples:
+        events.put(("samples", plot_samples))
+
+
+COMPARISON_TIME_LIMIT = 10.0  # s de simulation sans collision avant d'abandonner un scénario
+
+
+def animate_comparison(context, frames, events, run, scenarios):
+    """
+    Anime plusieurs scénarios côte à côte en une seule passe de rendu.
+
+    Les scénarios (dicts, voir simulation.batch.SwingBatch) sont intégrés
+    ensemble ; chacun est dessiné dans sa tuile (un viewport de la mosaïque)
+    et l'image complète n'est relue qu'une fois par image. Les résultats de
+    chaque tuile sont envoyés sur `events` (« comparison_results ») à chaque
+    nouvelle collision.
+    """
+    if not 0 < len(scenarios) <= MAX_COMPARISON_TILES:
+        raise ValueError(f"La comparaison accepte de 1 à {MAX_COMPARISON_TILES} scénarios.")
+    batch = SwingBatch(scenarios)
+    columns, rows = comparison_grid(len(batch))
+    results = [None] * len(batch)
+    flash_until = np.full(len(batch), np.inf)
+    background_texture = context.background_texture
+    clock = context.clock
+    dt = 1.0 / 60.0
+    last_time = time.time()
+    fps_count = 0
+    fps = 0.0
+
+    while run.is_active():
+        frame_start = time.perf_counter()
+        render_width, render_height = context.resolution.render_size
+        tile_width, tile_height = render_width // columns, render_height // rows
+        glViewport(0, 0, render_width, render_height)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+        current_time = time.time()
+        fps_count += 1
+        if current_time - last_time >= 1.0:
+            fps = fps_count / (current_time - last_time)
+            fps_count = 0
+            last_time = current_time
+
+        done = batch.collided & (batch.t >= flash_until)
+        active = ~done & (batch.t < COMPARISON_TIME_LIMIT)
+        if not active.any():
+            run.finish()
+            break
+        hits = batch.step(dt, active)
+        if len(hits):
+            for index in hits:
+                results[index] = batch.results(index)
+            flash_until[hits] = batch.t + 0.1
+            events.put(("comparison_results", list(results)))
+
+        for index, scenario in enumerate(batch.scenarios):
+            column, row = index % columns, index // columns
+            glViewport(column * tile_width, render_height - (row + 1) * tile_height, tile_width, tile_height)
+            set_render_size(tile_width, tile_height)
+            glMatrixMode(GL_PROJECTION)
+            glLoadIdentity()
+            gluOrtho2D(-5 , 5 , -2 , 5 )
+            glMatrixMode(GL_MODELVIEW)
+            glLoadIdentity()
+            glPushAttrib(GL_ALL_ATTRIB_BITS)
+            draw_background(background_texture)
+            draw_grid(labels=False)
+            if batch.collided[index] and batch.t < flash_until[index]:
+                color1 = color2 = (1, 0, 0) if scenario["impact_type"] == "frontal" else (1, 0.5, 0)
+            else:
+                color1, color2 = (0, 0, 1), (1, 0, 0)
+            draw_swing(batch.pivot1_x, batch.pivot_y, batch.theta1[index], LENGTH_SWING, color1)
+            draw_swing(batch.pivot2_x, batch.pivot_y, batch.theta2[index], LENGTH_SWING, color2)
+            draw_pivot(batch.pivot1_x, batch.pivot_y)
+            draw_pivot(batch.pivot2_x, batch.pivot_y)
+            render_text(f"{index + 1}. {scenario['age']} ans, {scenario['impact_type']}, "
+                        f"{scenario['max_height']:.2f} m", -4.8, 4.8, font_size=36)
+            if results[index] is not None:
+                render_text(f"F = {results[index]['force']:.0f} N, HIC15 = {results[index]['hic15']:.0f}",
+                            -4.8, 4.0, font_size=36)
+            glPopAttrib()
+
+        glViewport(0, 0, render_width, render_height)
+        set_render_size(render_width, render_height)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluOrtho2D(-5 , 5 , -2 , 5 )
+        render_fps(fps)
+
+        glFinish()
+        buffer = frames.frame_buffer(render_width, render_height)
+        glReadPixels(0, 0, render_width, render_height, GL_RGB, GL_UNSIGNED_BYTE, buffer)
+        frames.publish(buffer)
+        context.resolution.record(time.perf_counter() - frame_start)
+
+        clock.tick(60)
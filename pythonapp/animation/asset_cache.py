@@ -0,0 +1,60 @@
+# animation/asset_cache.py
+import hashlib
+import os
+
+import numpy as np
+from PIL import Image
+
+CACHE_DIR = os.environ.get(
+    "SWING_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "swing_simulator")
+)
+
+
+def _cache_path(image_path, size):
+    """Construit le nom du fichier de cache à partir de la source et de la taille cible."""
+    stat = os.stat(image_path)
+    key = f"{os.path.abspath(image_path)}|{stat.st_size}|{stat.st_mtime_ns}|{size[0]}x{size[1]}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(image_path))[0]
+    return os.path.join(CACHE_DIR, f"{name}-{size[0]}x{size[1]}-{digest}.npy")
+
+
+def load_scaled_image(image_path, size):
+    """
+    Retourne les pixels RGBA d'une image redimensionnée, prêts pour glTexImage2D.
+
+    Le premier appel décode l'image, la redimensionne à `size` et la retourne
+    verticalement (origine OpenGL en bas), puis enregistre le résultat brut sur
+    disque. Les appels suivants relisent ce fichier sans décodage JPEG.
+    Le cache est invalidé si la taille ou la date de modification de la source change.
+
+    Args:
+        image_path (str): Chemin de l'image source.
+        size (tuple): Taille cible (largeur, hauteur) en pixels.
+
+    Returns:
+        tuple: (pixels, from_cache) : tableau uint8 de forme (hauteur, largeur, 4),
+        et True si les pixels viennent du cache disque.
+    """
+    cache_path = _cache_path(image_path, size)
+    try:
+        pixels = np.load(cache_path)
+        if pixels.shape == (size[1], size[0], 4) and pixels.dtype == np.uint8:
+            return pixels, True
+    except (OSError, ValueError):
+        pass
+
+    with Image.open(image_path) as image:
+        image = image.convert("RGBA").resize(size, Image.BILINEAR)
+        pixels = np.ascontiguousarray(np.asarray(image)[::-1])
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, pixels)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Impossible d'écrire le cache de l'image : {e}")
+    return pixels, False
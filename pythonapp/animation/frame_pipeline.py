@@ -0,0 +1,113 @@
+# animation/frame_pipeline.py
+import queue
+import threading
+
+import numpy as np
+from PIL import Image, ImageTk
+
+
+class FrameMailbox:
+    """
+    Boîte aux lettres à une seule place entre le thread de rendu et Tk.
+
+    Chaque nouvelle image remplace la précédente si celle-ci n'a pas encore été
+    affichée : la mémoire reste bornée à une image quel que soit le retard de Tk.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self.frames_posted = 0
+        self.frames_dropped = 0
+        self.frames_displayed = 0
+
+    def post(self, frame):
+        """Dépose une image (appelé par le thread de rendu)."""
+        with self._lock:
+            if self._frame is not None:
+                self.frames_dropped += 1
+            self._frame = frame
+            self.frames_posted += 1
+
+    def frame_buffer(self, width, height):
+        """Retourne un tampon neuf (hauteur, largeur, 3) où le rendu écrit l'image."""
+        return np.empty((height, width, 3), dtype=np.uint8)
+
+    def publish(self, buffer):
+        """Dépose un tampon lu par glReadPixels (lignes de bas en haut) sous forme d'image PIL."""
+        height, width = buffer.shape[:2]
+        self.post(Image.frombuffer("RGB", (width, height), buffer, "raw", "RGB", 0, -1))
+
+    def take(self):
+        """Retire l'image en attente, ou None s'il n'y en a pas (appelé par Tk)."""
+        with self._lock:
+            frame = self._frame
+            self._frame = None
+            if frame is not None:
+                self.frames_displayed += 1
+            return frame
+
+    def stats(self):
+        """Retourne les compteurs (déposées, abandonnées, affichées)."""
+        with self._lock:
+            return {
+                "posted": self.frames_posted,
+                "dropped": self.frames_dropped,
+                "displayed": self.frames_displayed,
+            }
+
+
+class TkFramePresenter:
+    """
+    Unique scrutateur côté Tk : affiche la dernière image de la boîte aux lettres
+    et distribue les événements du rendu (résultats, fin d'animation) aux
+    gestionnaires, toujours depuis la boucle principale Tk.
+
+    Si `display_size` est donné, les images rendues à une résolution réduite
+    sont agrandies à cette taille avant affichage.
+    """
+
+    def __init__(self, root, animation_label, mailbox, events, handlers, interval_ms=15, display_size=None):
+        self.root = root
+        self.animation_label = animation_label
+        self.mailbox = mailbox
+        self.events = events
+        self.handlers = handlers
+        self.interval_ms = interval_ms
+        self.display_size = tuple(display_size) if display_size else None
+        self._photo = None
+        self._after_id = None
+
+    def start(self):
+        if self._after_id is None:
+            self._poll()
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def show(self, image):
+        """Affiche une image PIL en réutilisant la PhotoImage si la taille ne change pas."""
+        if self.display_size and image.size != self.display_size:
+            image = image.resize(self.display_size, Image.BILINEAR)
+        if self._photo is not None and (self._photo.width(), self._photo.height()) == image.size:
+            self._photo.paste(image)
+        else:
+            self._photo = ImageTk.PhotoImage(image)
+            self.animation_label.configure(image=self._photo)
+            self.animation_label.image = self._photo
+
+    def _poll(self):
+        frame = self.mailbox.take()
+        if frame is not None:
+            self.show(frame)
+        while True:
+            try:
+                name, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            handler = self.handlers.get(name)
+            if handler is not None:
+                handler(payload)
+        self._after_id = self.root.after(self.interval_ms, self._poll)
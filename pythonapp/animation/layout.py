@@ -0,0 +1,11 @@
+# animation/layout.py
+import math
+
+# Module volontairement sans dépendance graphique : l'interface l'importe au démarrage.
+MAX_COMPARISON_TILES = 16
+
+
+def comparison_grid(count):
+    """Nombre de colonnes et de lignes de la mosaïque pour `count` scénarios."""
+    columns = math.ceil(math.sqrt(count))
+    return columns, math.ceil(count / columns)
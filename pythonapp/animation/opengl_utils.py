@@ -1,20 +1,73 @@
 # rendering/opengl_utils.py
 import math
 import pygame
-from pygame.locals import *
-from OpenGL.GL import *
-from OpenGL.GLU import *
+from OpenGL.GL import (
+    GL_BLEND, GL_CLAMP_TO_EDGE, GL_COLOR_BUFFER_BIT, GL_DEPTH_TEST, GL_ENABLE_BIT, GL_LINEAR, GL_LINES,
+    GL_ONE_MINUS_SRC_ALPHA, GL_POINTS, GL_QUADS, GL_RGBA, GL_SRC_ALPHA, GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER,
+    GL_TEXTURE_MIN_FILTER, GL_TEXTURE_WRAP_S, GL_TEXTURE_WRAP_T, GL_UNSIGNED_BYTE,
+    glBegin, glBindTexture, glBlendFunc, glColor3f, glColor4f, glDisable, glDrawPixels, glEnable, glEnd,
+    glGenTextures, glLineWidth, glPointSize, glPopAttrib, glPopMatrix, glPushAttrib, glPushMatrix,
+    glRasterPos2f, glTexCoord2f, glTexImage2D, glTexParameteri, glVertex2f
+)
 
 from simulation.constants import PLATFORM_WIDTH
+from .asset_cache import load_scaled_image
+from .resolution import REFERENCE_RESOLUTION
 
+_font_cache = {}
+_render_size = REFERENCE_RESOLUTION
 
-def load_texture(image_path):
+
+def set_render_size(width, height):
+    """Déclare la taille en pixels du viewport courant ; texte et traits s'y adaptent."""
+    global _render_size
+    _render_size = (width, height)
+
+
+def layout_scale():
+    """Rapport entre le viewport courant et la résolution de référence (800x600)."""
+    return min(_render_size[0] / REFERENCE_RESOLUTION[0], _render_size[1] / REFERENCE_RESOLUTION[1])
+
+
+def pixel_to_gl():
+    """Taille d'un pixel du viewport courant en unités de la scène (10 m x 7 m)."""
+    return 10.0 / _render_size[0], 7.0 / _render_size[1]
+
+
+def _scaled_font(size):
+    return get_font(max(6, round(size * layout_scale())))
+
+
+def get_font(size, name="Arial"):
+    """Retourne une police pygame, créée une seule fois par (nom, taille)."""
+    font = _font_cache.get((name, size))
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _font_cache[(name, size)] = font
+    return font
+
+
+def clear_font_cache():
+    """Oublie les polices en cache (à appeler avant pygame.quit())."""
+    _font_cache.clear()
+
+
+def load_texture(image_path, size=None):
+    """
+    Charge une texture OpenGL. Si `size` est donné, l'image est redimensionnée
+    et lue depuis le cache disque (voir asset_cache.load_scaled_image).
+    """
     try:
-        image = pygame.image.load(image_path)
-        print(f"Image loaded: {image_path}, size: {image.get_size()}")
-        image = image.convert_alpha()
-        image_data = pygame.image.tostring(image, "RGBA", 1)
-        width, height = image.get_size()
+        if size is not None:
+            image_data, from_cache = load_scaled_image(image_path, size)
+            width, height = size
+            print(f"Image loaded: {image_path}, size: {size}" + (" (cached)" if from_cache else ""))
+        else:
+            image = pygame.image.load(image_path)
+            print(f"Image loaded: {image_path}, size: {image.get_size()}")
+            image = image.convert_alpha()
+            image_data = pygame.image.tostring(image, "RGBA", 1)
+            width, height = image.get_size()
         texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, texture_id)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
@@ -29,10 +82,35 @@ def load_texture(image_path):
         return None
 
 
+def draw_background(texture):
+    """Dessine l'image de fond (ou un aplat vert si la texture manque) sur toute la scène."""
+    if texture:
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glDisable(GL_DEPTH_TEST)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 0); glVertex2f(-5 , -2 )
+        glTexCoord2f(1, 0); glVertex2f(5 , -2 )
+        glTexCoord2f(1, 1); glVertex2f(5 , 5 )
+        glTexCoord2f(0, 1); glVertex2f(-5 , 5 )
+        glEnd()
+        glDisable(GL_TEXTURE_2D)
+        glEnable(GL_DEPTH_TEST)
+    else:
+        # Fallback quad to prevent black background
+        glBegin(GL_QUADS)
+        glColor3f(0.0, 0.5, 0.0)  # Dark green
+        glVertex2f(-5 , -2 )
+        glVertex2f(5 , -2 )
+        glVertex2f(5 , 5 )
+        glVertex2f(-5 , 5 )
+        glEnd()
+
+
 def draw_swing(x_pivot, y_pivot, angle_rad, length, color):
     glDisable(GL_DEPTH_TEST)
     glColor3f(*color)
-    glLineWidth(5.0)
+    glLineWidth(max(1.0, 5.0 * layout_scale()))
     x_end = x_pivot + length * math.sin(angle_rad)
     y_end = y_pivot - length * math.cos(angle_rad)
     glBegin(GL_LINES)
@@ -53,14 +131,15 @@ def draw_swing(x_pivot, y_pivot, angle_rad, length, color):
 def draw_pivot(x, y):
     glDisable(GL_DEPTH_TEST)
     glColor3f(0, 0, 0)
-    glPointSize(10)
+    glPointSize(max(2.0, 10 * layout_scale()))
     glBegin(GL_POINTS)
     glVertex2f(x, y)
     glEnd()
     glEnable(GL_DEPTH_TEST)
 
 
-def draw_grid():
+def draw_grid(labels=True):
+    """Dessine la grille d'un mètre, avec ses graduations si `labels`."""
     glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT)
     glPushMatrix()
     glDisable(GL_DEPTH_TEST)
@@ -74,40 +153,41 @@ def draw_grid():
         glVertex2f(-5, y)
         glVertex2f(5, y)
     glEnd()
-    try:
-        font = pygame.font.SysFont("Arial", 12)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        for x in range(-5, 6, 1):
-            if x != 0:
-                text = font.render(str(x), True, (255, 255, 255))
-                text_surface = pygame.image.tostring(text, "RGBA", True)
-                glColor4f(0, 0, 0, 0.8)
-                glBegin(GL_QUADS)
-                glVertex2f(x - 0.15, -1.95)
-                glVertex2f(x + 0.15, -1.95)
-                glVertex2f(x + 0.15, -1.75)
-                glVertex2f(x - 0.15, -1.75)
-                glEnd()
-                glRasterPos2f(x - 0.1, -1.9)
-                glDrawPixels(text.get_width(), text.get_height(), GL_RGBA, GL_UNSIGNED_BYTE, text_surface)
-        for y in range(-2, 6, 1):
-            if y != 0:
-                text = font.render(str(y), True, (255, 255, 255))
-                text_surface = pygame.image.tostring(text, "RGBA", True)
-                glColor4f(0, 0, 0, 0.8)
-                glBegin(GL_QUADS)
-                glVertex2f(-4.95, y - 0.1)
-                glVertex2f(-4.65, y - 0.1)
-                glVertex2f(-4.65, y + 0.1)
-                glVertex2f(-4.95, y + 0.1)
-                glEnd()
-                glRasterPos2f(-4.9, y - 0.05)
-                glDrawPixels(text.get_width(), text.get_height(), GL_RGBA, GL_UNSIGNED_BYTE, text_surface)
-        glDisable(GL_BLEND)
-    except Exception as e:
-        print(f"Error rendering grid labels: {e}")
-        glDisable(GL_BLEND)
+    if labels:
+        try:
+            font = _scaled_font(12)
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            for x in range(-5, 6, 1):
+                if x != 0:
+                    text = font.render(str(x), True, (255, 255, 255))
+                    text_surface = pygame.image.tostring(text, "RGBA", True)
+                    glColor4f(0, 0, 0, 0.8)
+                    glBegin(GL_QUADS)
+                    glVertex2f(x - 0.15, -1.95)
+                    glVertex2f(x + 0.15, -1.95)
+                    glVertex2f(x + 0.15, -1.75)
+                    glVertex2f(x - 0.15, -1.75)
+                    glEnd()
+                    glRasterPos2f(x - 0.1, -1.9)
+                    glDrawPixels(text.get_width(), text.get_height(), GL_RGBA, GL_UNSIGNED_BYTE, text_surface)
+            for y in range(-2, 6, 1):
+                if y != 0:
+                    text = font.render(str(y), True, (255, 255, 255))
+                    text_surface = pygame.image.tostring(text, "RGBA", True)
+                    glColor4f(0, 0, 0, 0.8)
+                    glBegin(GL_QUADS)
+                    glVertex2f(-4.95, y - 0.1)
+                    glVertex2f(-4.65, y - 0.1)
+                    glVertex2f(-4.65, y + 0.1)
+                    glVertex2f(-4.95, y + 0.1)
+                    glEnd()
+                    glRasterPos2f(-4.9, y - 0.05)
+                    glDrawPixels(text.get_width(), text.get_height(), GL_RGBA, GL_UNSIGNED_BYTE, text_surface)
+            glDisable(GL_BLEND)
+        except Exception as e:
+            print(f"Error rendering grid labels: {e}")
+            glDisable(GL_BLEND)
     glPopMatrix()
     glPopAttrib()
 
@@ -117,13 +197,12 @@ def render_fps(fps):
     try:
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        font = pygame.font.SysFont("Arial", 24)
+        font = _scaled_font(24)
         text = font.render(f"FPS: {fps:.1f}", True, (255, 255, 255))
         text_surface = pygame.image.tostring(text, "RGBA", True)
         text_width = text.get_width()
         text_height = text.get_height()
-        pixel_to_gl_x = 10.0 / 800
-        pixel_to_gl_y = 7.0 / 600
+        pixel_to_gl_x, pixel_to_gl_y = pixel_to_gl()
         gl_text_width = text_width * pixel_to_gl_x
         gl_text_height = text_height * pixel_to_gl_y
         x_pos = -4.25
@@ -151,13 +230,12 @@ def render_text(text, x, y, font_size=16):
     try:
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        font = pygame.font.SysFont("Arial", font_size)
+        font = _scaled_font(font_size)
         text_surface = font.render(text, True, (255, 255, 255))
         text_data = pygame.image.tostring(text_surface, "RGBA", True)
         text_width = text_surface.get_width()
         text_height = text_surface.get_height()
-        pixel_to_gl_x = 10.0 / 800
-        pixel_to_gl_y = 7.0 / 600
+        pixel_to_gl_x, pixel_to_gl_y = pixel_to_gl()
         gl_text_width = text_width * pixel_to_gl_x
         gl_text_height = text_height * pixel_to_gl_y
         padding_x = 0.1
@@ -0,0 +1,222 @@
+# animation/render_worker.py
+import multiprocessing
+import queue
+import threading
+
+from .frame_pipeline import FrameMailbox
+from .shared_frames import SharedFrameRing
+from .resolution import DEFAULT_RESOLUTION
+
+_RUN = "run"
+_COMPARE = "compare"
+_SHUTDOWN = "shutdown"
+
+
+def _render_settings(resolution, dynamic_resolution, target_fps):
+    return {
+        "window_width": resolution[0],
+        "window_height": resolution[1],
+        "dynamic_resolution": dynamic_resolution,
+        "target_frame_time": 1.0 / target_fps,
+    }
+
+
+class RenderRun:
+    """
+    Une animation soumise au moteur de rendu, identifiée par son numéro.
+
+    L'animation reste active tant que `running` est levé et qu'aucune autre n'a
+    été soumise depuis (le compteur partagé `run_ids` vaut encore `run_id`).
+    Une animation remplacée s'arrête donc d'elle-même, sans baisser `running`
+    ni envoyer « finished » à la place de la nouvelle.
+    """
+
+    def __init__(self, running, run_ids, run_id, events):
+        self.running = running
+        self.run_ids = run_ids
+        self.run_id = run_id
+        self.events = events
+
+    def is_current(self):
+        return self.run_ids.value == self.run_id
+
+    def is_active(self):
+        return self.running.is_set() and self.is_current()
+
+    def finish(self):
+        """Termine l'animation : baisse `running` et envoie « finished », si elle est encore la dernière soumise."""
+        with self.run_ids.get_lock():
+            if self.is_current():
+                self.running.clear()
+                self.events.put(("finished", None))
+
+
+def serve_render_commands(commands, frames, events, running, run_ids, render_settings=None):
+    """
+    Boucle du moteur de rendu : crée le contexte une fois (avec les options de
+    `render_settings`, voir RenderContext), puis anime chaque scénario reçu sur
+    `commands` jusqu'à la commande d'arrêt. Les commandes remplacées avant
+    d'avoir commencé (voir RenderRun) sont ignorées.
+    """
+    # Pile graphique (pygame, PyOpenGL) importée ici, dans le thread ou le processus de rendu
+    from .animation import RenderContext, animate_swings, animate_comparison
+
+    context = RenderContext(**(render_settings or {}))
+    try:
+        while True:
+            command, run_id, params = commands.get()
+            if command == _SHUTDOWN:
+                break
+            run = RenderRun(running, run_ids, run_id, events)
+            if not run.is_current():
+                continue
+            try:
+                if command == _COMPARE:
+                    animate_comparison(context, frames, events, run, params)
+                else:
+                    animate_swings(context, frames, events, run, *params)
+            except Exception as e:
+                print(f"Erreur pendant l'animation : {e}")
+                run.finish()
+    finally:
+        context.close()
+
+
+def _render_process_main(ring_name, commands, events, running, run_ids, render_settings):
+    """Point d'entrée du processus de rendu : s'attache à l'anneau partagé créé par Tk."""
+    ring = SharedFrameRing(name=ring_name)
+    try:
+        serve_render_commands(commands, ring, events, running, run_ids, render_settings)
+    finally:
+        ring.close()
+
+
+class RenderWorker:
+    """
+    Thread de rendu de longue durée.
+
+    Le contexte pygame/OpenGL, la texture de fond et les polices sont créés une
+    seule fois au démarrage du thread puis réutilisés par chaque animation.
+    Les scénarios sont transmis par une file de commandes ; le thread se met en
+    attente entre deux animations au lieu de se terminer.
+
+    Le thread ne touche jamais à Tk : les images passent par `mailbox`, les
+    résultats et la fin d'animation par `events`, et l'arrêt est commandé par
+    l'événement `running`. Chaque soumission incrémente le compteur `run_ids`,
+    ce qui arrête l'animation précédente même si `running` a été relevé entre-temps.
+
+    `resolution` est la résolution d'affichage ; `dynamic_resolution` active
+    l'ajustement de la taille de rendu pour tenir `target_fps`.
+    """
+
+    def __init__(self, resolution=DEFAULT_RESOLUTION, dynamic_resolution=False, target_fps=60):
+        self.render_settings = _render_settings(resolution, dynamic_resolution, target_fps)
+        self.mailbox = FrameMailbox()
+        self.events = queue.Queue()
+        self.running = threading.Event()
+        self.run_ids = multiprocessing.Value("q", 0)
+        self._commands = queue.Queue()
+        self._runner = threading.Thread(
+            target=serve_render_commands,
+            args=(self._commands, self.mailbox, self.events, self.running, self.run_ids, self.render_settings),
+            name="render-worker", daemon=True
+        )
+
+    def start(self):
+        """Démarre le thread et prépare le contexte de rendu sans attendre le premier scénario."""
+        self._runner.start()
+
+    def _submit(self, command, params):
+        with self.run_ids.get_lock():
+            self.run_ids.value += 1
+            run_id = self.run_ids.value
+            self.running.set()
+        self._commands.put((command, run_id, params))
+
+    def submit(self, max_angle, age, mass1_lbs, mass2_lbs, v_init1, v_init2, max_height, impact_type):
+        """Lève `running` et met en file un scénario à animer avec ces paramètres, à la place du précédent."""
+        self._submit(_RUN, (max_angle, age, mass1_lbs, mass2_lbs, v_init1, v_init2, max_height, impact_type))
+
+    def submit_comparison(self, scenarios):
+        """Comme submit(), pour une comparaison (liste de dicts, voir SwingBatch)."""
+        self._submit(_COMPARE, [dict(scenario) for scenario in scenarios])
+
+    def stop(self):
+        """Interrompt l'animation en cours ; le contexte reste disponible."""
+        self.running.clear()
+
+    def shutdown(self, timeout=2.0):
+        """Arrête l'animation puis le thread, qui libère le contexte avant de se terminer."""
+        self.running.clear()
+        self._commands.put((_SHUTDOWN, None, None))
+        if self._runner.is_alive() and threading.current_thread() is not self._runner:
+            self._runner.join(timeout)
+
+
+class RenderProcess(RenderWorker):
+    """
+    Variante de RenderWorker qui exécute le rendu dans un processus séparé.
+
+    Le rendu et la lecture des pixels ne partagent plus le GIL avec la boucle Tk :
+    les images transitent par un anneau de tampons en mémoire partagée
+    (`mailbox`, un SharedFrameRing), les commandes et événements par des files
+    multiprocessing. L'interface est identique à celle de RenderWorker.
+
+    Un thread de surveillance détecte la fin inattendue du processus (erreur à
+    l'initialisation, plantage du pilote...) : l'animation en cours est alors
+    terminée comme si elle avait abouti, pour que l'interface ne reste pas bloquée.
+    """
+
+    def __init__(self, resolution=DEFAULT_RESOLUTION, dynamic_resolution=False, target_fps=60, slots=3):
+        mp = multiprocessing.get_context("spawn")
+        self.render_settings = _render_settings(resolution, dynamic_resolution, target_fps)
+        self.mailbox = SharedFrameRing(slots=slots, width=resolution[0], height=resolution[1])
+        self.events = mp.Queue()
+        self.running = mp.Event()
+        self.run_ids = mp.Value("q", 0)
+        self._commands = mp.Queue()
+        self._runner = mp.Process(
+            target=_render_process_main,
+            args=(self.mailbox.name, self._commands, self.events, self.running, self.run_ids,
+                  self.render_settings),
+            name="render-process", daemon=True
+        )
+        self._closing = False
+        self._process_dead = False
+        self._watcher = threading.Thread(target=self._watch_process, name="render-process-watcher", daemon=True)
+
+    def start(self):
+        """Démarre le processus de rendu et sa surveillance."""
+        self._runner.start()
+        self._watcher.start()
+
+    def _watch_process(self):
+        self._runner.join()
+        if self._closing:
+            return
+        print(f"Le processus de rendu s'est arrêté de façon inattendue (code {self._runner.exitcode}).")
+        with self.run_ids.get_lock():
+            self._process_dead = True
+            if self.running.is_set():
+                self.running.clear()
+                self.events.put(("finished", None))
+
+    def _submit(self, command, params):
+        with self.run_ids.get_lock():
+            if not self._process_dead:
+                super()._submit(command, params)
+                return
+        print("Le processus de rendu n'est plus disponible : animation ignorée.")
+        self.events.put(("finished", None))
+
+    def shutdown(self, timeout=2.0):
+        """Arrête le processus de rendu puis libère l'anneau partagé."""
+        self._closing = True
+        self.running.clear()
+        self._commands.put((_SHUTDOWN, None, None))
+        if self._runner.is_alive():
+            self._runner.join(timeout)
+            if self._runner.is_alive():
+                self._runner.terminate()
+        self.mailbox.close()
+        self.mailbox.unlink()
@@ -0,0 +1,69 @@
+# animation/resolution.py
+from collections import deque
+
+DEFAULT_RESOLUTION = (800, 600)
+# Résolution pour laquelle la mise en page (texte, traits, grille) a été conçue
+REFERENCE_RESOLUTION = (800, 600)
+
+
+def parse_resolution(text):
+    """Convertit « LARGEURxHAUTEUR » (ex. « 1024x768 ») en tuple d'entiers."""
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Résolution invalide : {text!r} (format attendu : 800x600).")
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Résolution invalide : {text!r} (dimensions positives attendues).")
+    return width, height
+
+
+class DynamicResolution:
+    """
+    Ajuste la taille de rendu interne pour tenir un budget de temps par image.
+
+    La résolution d'affichage (`width` x `height`) est fixe ; le rendu se fait à
+    une fraction `scale` de celle-ci, puis l'image est agrandie à l'affichage.
+    Après chaque fenêtre de `window` images, le temps moyen mesuré est comparé
+    à `target_frame_time` : au-dessus, l'échelle baisse d'un cran ; nettement
+    en dessous (`headroom`), elle remonte d'un cran. Désactivé, le rendu reste
+    à pleine résolution.
+    """
+
+    def __init__(self, width, height, target_frame_time=1.0 / 60.0, enabled=True,
+                 min_scale=0.5, max_scale=1.0, step=0.1, window=30, headroom=0.7):
+        self.width = width
+        self.height = height
+        self.target_frame_time = target_frame_time
+        self.enabled = enabled
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.step = step
+        self.headroom = headroom
+        self.scale = max_scale
+        self._samples = deque(maxlen=window)
+
+    @property
+    def render_size(self):
+        """Taille de rendu interne (largeur, hauteur), arrondie à un nombre pair de pixels."""
+        width = max(2, int(self.width * self.scale) // 2 * 2)
+        height = max(2, int(self.height * self.scale) // 2 * 2)
+        return width, height
+
+    def record(self, frame_time):
+        """Enregistre le temps de travail d'une image (s) ; retourne True si l'échelle a changé."""
+        if not self.enabled:
+            return False
+        self._samples.append(frame_time)
+        if len(self._samples) < self._samples.maxlen:
+            return False
+        average = sum(self._samples) / len(self._samples)
+        scale = self.scale
+        if average > self.target_frame_time:
+            scale = max(self.min_scale, round(scale - self.step, 3))
+        elif average < self.target_frame_time * self.headroom:
+            scale = min(self.max_scale, round(scale + self.step, 3))
+        self._samples.clear()
+        if scale == self.scale:
+            return False
+        self.scale = scale
+        return True
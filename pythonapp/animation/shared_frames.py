@@ -0,0 +1,118 @@
+# animation/shared_frames.py
+from multiprocessing import shared_memory
+
+import numpy as np
+from PIL import Image
+
+# En-tête : [nombre de tampons, largeur max, hauteur max, numéro de la dernière image écrite]
+# puis, par tampon, [numéro, largeur, hauteur].
+_HEADER_GEOMETRY = 3
+_HEADER_WRITE_SEQ = 3
+_HEADER_FIELDS = 4
+_SLOT_FIELDS = 3
+
+
+class SharedFrameRing:
+    """
+    Anneau de tampons RGB préalloués dans un segment `multiprocessing.shared_memory`.
+
+    Le processus de rendu écrit chaque image (lignes de bas en haut, telles que
+    renvoyées par glReadPixels) dans le tampon suivant puis publie son numéro de
+    séquence ; le processus Tk lit le tampon le plus récent directement dans la
+    mémoire partagée, sans passer par pickle. Un tampon réécrit pendant la
+    lecture est détecté grâce à son numéro et l'image est abandonnée.
+
+    Le créateur (côté Tk) appelle `unlink()` à la fin ; l'autre processus
+    s'attache avec `SharedFrameRing(name=...)` et appelle seulement `close()`.
+    Le nombre et la taille des tampons sont écrits dans l'en-tête à la création
+    et relus à l'attachement : `slots`, `width` et `height` ne servent qu'au créateur.
+    """
+
+    def __init__(self, name=None, slots=3, width=800, height=600):
+        create = name is None
+        if create:
+            header_size = (_HEADER_FIELDS + _SLOT_FIELDS * slots) * 8
+            self._shm = shared_memory.SharedMemory(create=True, size=header_size + slots * width * height * 3)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            slots, width, height = (int(value) for value in
+                                    np.ndarray((_HEADER_GEOMETRY,), dtype=np.int64, buffer=self._shm.buf))
+            header_size = (_HEADER_FIELDS + _SLOT_FIELDS * slots) * 8
+        slot_size = width * height * 3
+        self.name = self._shm.name
+        self.slots = slots
+        self.max_width = width
+        self.max_height = height
+        self._header = np.ndarray((_HEADER_FIELDS + _SLOT_FIELDS * slots,), dtype=np.int64, buffer=self._shm.buf)
+        self._pixels = np.ndarray((slots, slot_size), dtype=np.uint8, buffer=self._shm.buf, offset=header_size)
+        if create:
+            self._header[:] = 0
+            self._header[:_HEADER_GEOMETRY] = (slots, width, height)
+        self._pending_seq = 0
+        self._last_seq = 0
+        self.frames_dropped = 0
+        self.frames_displayed = 0
+
+    def _slot_header(self, slot):
+        base = _HEADER_FIELDS + _SLOT_FIELDS * slot
+        return self._header[base:base + _SLOT_FIELDS]
+
+    # Côté rendu -----------------------------------------------------------
+
+    def frame_buffer(self, width, height):
+        """Réserve le tampon suivant et retourne une vue (hauteur, largeur, 3) où écrire l'image."""
+        if width > self.max_width or height > self.max_height:
+            raise ValueError(f"Image {width}x{height} plus grande que les tampons partagés "
+                             f"({self.max_width}x{self.max_height}).")
+        self._pending_seq = int(self._header[_HEADER_WRITE_SEQ]) + 1
+        slot = self._pending_seq % self.slots
+        slot_header = self._slot_header(slot)
+        slot_header[0] = -1  # Tampon en cours d'écriture
+        slot_header[1] = width
+        slot_header[2] = height
+        return self._pixels[slot, :width * height * 3].reshape(height, width, 3)
+
+    def publish(self, _buffer):
+        """Publie le tampon réservé par le dernier appel à frame_buffer()."""
+        seq = self._pending_seq
+        self._slot_header(seq % self.slots)[0] = seq
+        self._header[_HEADER_WRITE_SEQ] = seq
+
+    # Côté Tk ----------------------------------------------------------------
+
+    def take(self):
+        """Retourne la dernière image publiée (PIL, remise à l'endroit), ou None."""
+        seq = int(self._header[_HEADER_WRITE_SEQ])
+        if seq == self._last_seq:
+            return None
+        slot_header = self._slot_header(seq % self.slots)
+        if slot_header[0] != seq:
+            return None
+        width, height = int(slot_header[1]), int(slot_header[2])
+        image = Image.frombuffer(
+            "RGB", (width, height), self._pixels[seq % self.slots, :width * height * 3], "raw", "RGB", 0, -1
+        ).copy()
+        if slot_header[0] != seq:
+            # Tampon réécrit pendant la copie : l'image sera comptée comme abandonnée
+            # avec l'écart de numéros à la prochaine lecture réussie.
+            return None
+        self.frames_dropped += max(seq - self._last_seq - 1, 0)
+        self._last_seq = seq
+        self.frames_displayed += 1
+        return image
+
+    def stats(self):
+        """Retourne les compteurs (publiées, abandonnées, affichées)."""
+        return {
+            "posted": int(self._header[_HEADER_WRITE_SEQ]),
+            "dropped": self.frames_dropped,
+            "displayed": self.frames_displayed,
+        }
+
+    def close(self):
+        self._header = None
+        self._pixels = None
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
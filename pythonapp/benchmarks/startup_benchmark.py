@@ -0,0 +1,101 @@
+# benchmarks/startup_benchmark.py
+"""
+Mesure le temps d'import et de démarrage, et vérifie qu'ils restent sous leur budget.
+
+Chaque mesure est faite dans un interpréteur neuf (meilleur de plusieurs essais).
+Le script vérifie aussi quels modules lourds sont chargés : la ligne de commande
+ne doit jamais charger la pile graphique, et l'interface doit s'afficher avant
+pygame/PyOpenGL. Code de sortie 1 si un budget est dépassé.
+
+Usage : python benchmarks/startup_benchmark.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAPHICS_MODULES = ("pygame", "OpenGL", "PIL")
+
+# (nom, code exécuté dans un interpréteur neuf, budget en s, modules interdits)
+# Le code mesure lui-même `elapsed` et l'écrit avec la liste des modules chargés,
+# sur une ligne préfixée par _RESULT_MARKER pour la distinguer des autres sorties.
+_RESULT_MARKER = "STARTUP_PROBE "
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+print("STARTUP_PROBE " + json.dumps({{"elapsed": elapsed, "modules": sorted({{m.split(".")[0] for m in sys.modules}})}}))
+"""
+
+# Le démarrage du moteur de rendu (déclenché par <Map>) est neutralisé : seul
+# l'affichage de la fenêtre est mesuré, sans contexte GL à chaque essai.
+_WINDOW_BODY = """
+import tkinter as tk
+from ui.interface import SwingSimulationApp
+SwingSimulationApp.start_renderer = lambda self: None
+root = tk.Tk()
+app = SwingSimulationApp(root)
+mapped = []
+def on_map(event):
+    if event.widget is root and not mapped:
+        mapped.append((time.perf_counter(), sorted({m.split(".")[0] for m in sys.modules})))
+root.bind("<Map>", on_map, add="+")
+while not mapped:
+    root.update()
+root.destroy()
+print("STARTUP_PROBE " + json.dumps({"elapsed": mapped[0][0] - start, "modules": mapped[0][1]}))
+raise SystemExit
+"""
+
+CASES = [
+    ("import simulation.calculations", "import simulation.calculations", 0.10,
+     GRAPHICS_MODULES + ("tkinter", "numpy")),
+    ("import ui.interface", "import ui.interface", 0.25, GRAPHICS_MODULES),
+    ("python -m simulation (lot)", "from simulation.__main__ import main\nmain(['--ages', '1,2,3,4,5'])", 1.00,
+     GRAPHICS_MODULES + ("tkinter",)),
+]
+WINDOW_CASE = ("fenêtre affichée", _WINDOW_BODY, 1.00, ("pygame", "OpenGL"))
+
+
+def run_probe(body):
+    code = _PROBE.format(body=body)
+    output = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    results = [line for line in output.splitlines() if line.startswith(_RESULT_MARKER)]
+    if not results:
+        raise RuntimeError(f"Pas de résultat dans la sortie de la mesure :\n{output}")
+    return json.loads(results[-1][len(_RESULT_MARKER):])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="nombre d'essais par mesure (défaut : 5)")
+    args = parser.parse_args(argv)
+
+    cases = list(CASES)
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        cases.append(WINDOW_CASE)
+    else:
+        print("Pas d'affichage disponible : mesure de la fenêtre ignorée.")
+
+    failures = 0
+    for name, body, budget, forbidden in cases:
+        wall_start = time.perf_counter()
+        probes = [run_probe(body) for _ in range(args.repeat)]
+        wall = (time.perf_counter() - wall_start) / args.repeat
+        best = min(probe["elapsed"] for probe in probes)
+        loaded = sorted(set(forbidden) & set(probes[0]["modules"]))
+        ok = best <= budget and not loaded
+        failures += not ok
+        status = "OK " if ok else "ÉCHEC"
+        print(f"{status} {name:<32} {best * 1000:7.1f} ms (budget {budget * 1000:.0f} ms, "
+              f"processus {wall * 1000:.0f} ms)" + (f" modules interdits : {', '.join(loaded)}" if loaded else ""))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# simulation/__main__.py
+"""
+Simulation en ligne de commande, sans interface ni rendu (pygame et PyOpenGL ne sont pas chargés).
+
+Exemple : python -m simulation --ages 1,2,3,4,5 --heights 1.5 --impact frontal concentré
+"""
+import argparse
+import sys
+
+from .batch import run_batch
+from .constants import ANTHROPOMETRIC_DATA, LENGTH_SWING
+
+
+def _float_list(text):
+    return [float(value) for value in text.split(",") if value.strip()]
+
+
+def _int_list(text):
+    return [int(value) for value in text.split(",") if value.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m simulation",
+                                     description="Simulation de collisions de balançoires (lot de scénarios)")
+    parser.add_argument("--ages", type=_int_list, default=[3], help="âges de l'enfant, ex. 1,2,3 (défaut : 3)")
+    parser.add_argument("--heights", type=_float_list, default=[1.5],
+                        help="hauteurs d'oscillation max en m, ex. 1,1.5 (défaut : 1.5)")
+    parser.add_argument("--impact", nargs="+", choices=["frontal", "concentré"], default=["frontal"],
+                        help="types d'impact (défaut : frontal)")
+    parser.add_argument("--mass1", type=float, default=100, help="masse balançoire 1 en lbs (défaut : 100)")
+    parser.add_argument("--mass2", type=float, default=100, help="masse balançoire 2 en lbs (défaut : 100)")
+    parser.add_argument("--v-init1", type=float, default=0, help="vitesse initiale balançoire 1 en m/s")
+    parser.add_argument("--v-init2", type=float, default=0, help="vitesse initiale balançoire 2 en m/s")
+    args = parser.parse_args(argv)
+
+    if any(age not in ANTHROPOMETRIC_DATA for age in args.ages):
+        parser.error("les âges doivent être compris entre 1 et 5 ans")
+    if any(not 0 < height <= LENGTH_SWING for height in args.heights):
+        parser.error(f"les hauteurs doivent être comprises entre 0 et {LENGTH_SWING} m")
+    if args.mass1 <= 0 or args.mass2 <= 0:
+        parser.error("la masse des balançoires doit être supérieure à 0")
+    if args.v_init1 < 0 or args.v_init2 < 0:
+        parser.error("les vitesses initiales ne peuvent pas être négatives")
+
+    scenarios = [
+        {"age": age, "max_height": height, "impact_type": impact_type,
+         "mass1_lbs": args.mass1, "mass2_lbs": args.mass2, "v_init1": args.v_init1, "v_init2": args.v_init2}
+        for age in args.ages for height in args.heights for impact_type in args.impact
+    ]
+    for scenario, results in zip(scenarios, run_batch(scenarios)):
+        label = f"{scenario['age']} ans, {scenario['impact_type']}, {scenario['max_height']:.2f} m"
+        if results is None:
+            print(f"{label} : pas de collision")
+            continue
+        print(f"{label} : {results['relative_velocity']:.2f} m/s, {results['force']:.0f} N, "
+              f"{results['pressure_mpa']:.2f} MPa, HIC15 {results['hic15']:.0f} | "
+              f"décapitation : {results['decapitation_risk']}, fracture : {results['cervical_fracture_risk']}, "
+              f"commotion : {results['concussion_risk']}, HIC : {results['hic_risk']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
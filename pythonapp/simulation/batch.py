@@ -0,0 +1,125 @@
+# simulation/batch.py
+import math
+
+import numpy as np
+
+from .constants import G, LENGTH_SWING, LBS_TO_KG, PLATFORM_WIDTH
+from .calculations import calculate_max_angle, calculate_collision, assess_impact
+
+DAMPING_COEFF = 0.02
+RESTITUTION_COEFF = 0.5
+
+
+def check_platform_collisions(theta1, theta2, pivot1_x=0, pivot1_y=LENGTH_SWING,
+                              pivot2_x=0, pivot2_y=LENGTH_SWING, length=LENGTH_SWING):
+    """Version vectorisée de check_platform_collision pour des tableaux d'angles."""
+    x1 = pivot1_x + length * np.sin(theta1)
+    y1 = pivot1_y - length * np.cos(theta1)
+    x2 = pivot2_x + length * np.sin(theta2)
+    y2 = pivot2_y - length * np.cos(theta2)
+    ax, ay = x1 - PLATFORM_WIDTH * np.cos(theta1), y1 - PLATFORM_WIDTH * np.sin(theta1)
+    bx, by = x1 + PLATFORM_WIDTH * np.cos(theta1), y1 + PLATFORM_WIDTH * np.sin(theta1)
+    cx, cy = x2 - PLATFORM_WIDTH * np.cos(theta2), y2 - PLATFORM_WIDTH * np.sin(theta2)
+    dx, dy = x2 + PLATFORM_WIDTH * np.cos(theta2), y2 + PLATFORM_WIDTH * np.sin(theta2)
+
+    def ccw(px, py, qx, qy, rx, ry):
+        return (ry - py) * (qx - px) > (qy - py) * (rx - px)
+
+    intersect = (ccw(ax, ay, cx, cy, dx, dy) != ccw(bx, by, cx, cy, dx, dy)) & \
+        (ccw(ax, ay, bx, by, cx, cy) != ccw(ax, ay, bx, by, dx, dy))
+    min_distance = np.minimum.reduce([
+        np.hypot(ax - cx, ay - cy), np.hypot(ax - dx, ay - dy),
+        np.hypot(bx - cx, by - cy), np.hypot(bx - dx, by - dy)
+    ])
+    return intersect | (min_distance < 0.01)
+
+
+class SwingBatch:
+    """
+    Lot de scénarios intégrés ensemble, un élément de tableau NumPy par scénario.
+
+    Chaque scénario est un dict avec les clés age, max_height, mass1_lbs,
+    mass2_lbs, v_init1, v_init2 et impact_type. Le pas d'intégration, la
+    détection de collision et la collision elle-même reprennent ceux de
+    l'animation d'un scénario unique, appliqués à tous les éléments à la fois.
+    """
+
+    def __init__(self, scenarios, pivot1_x=-2.0, pivot2_x=2.0, pivot_y=LENGTH_SWING):
+        self.scenarios = [dict(scenario) for scenario in scenarios]
+        self.pivot1_x = pivot1_x
+        self.pivot2_x = pivot2_x
+        self.pivot_y = pivot_y
+        max_angle_rad = np.radians([calculate_max_angle(s["max_height"]) for s in self.scenarios])
+        self.mass1_kg = np.array([s["mass1_lbs"] for s in self.scenarios], dtype=float) * LBS_TO_KG
+        self.mass2_kg = np.array([s["mass2_lbs"] for s in self.scenarios], dtype=float) * LBS_TO_KG
+        self.theta1 = -max_angle_rad
+        self.theta2 = max_angle_rad.copy()
+        self.theta1_dot = np.array([s["v_init1"] for s in self.scenarios], dtype=float) / LENGTH_SWING
+        self.theta2_dot = -np.array([s["v_init2"] for s in self.scenarios], dtype=float) / LENGTH_SWING
+        self.collided = np.zeros(len(self.scenarios), dtype=bool)
+        self.impact_velocity1 = np.zeros(len(self.scenarios))
+        self.impact_velocity2 = np.zeros(len(self.scenarios))
+        self.t = 0.0
+
+    def __len__(self):
+        return len(self.scenarios)
+
+    def step(self, dt, active=None):
+        """
+        Avance d'un pas les scénarios `active` (masque booléen, tous par défaut).
+
+        Returns:
+            numpy.ndarray: Indices des scénarios entrés en collision pendant ce pas.
+        """
+        if active is None:
+            active = np.ones(len(self), dtype=bool)
+        accel1 = -(G / LENGTH_SWING) * np.sin(self.theta1) - (DAMPING_COEFF / self.mass1_kg) * self.theta1_dot
+        accel2 = -(G / LENGTH_SWING) * np.sin(self.theta2) - (DAMPING_COEFF / self.mass2_kg) * self.theta2_dot
+        self.theta1_dot = np.where(active, self.theta1_dot + accel1 * dt, self.theta1_dot)
+        self.theta2_dot = np.where(active, self.theta2_dot + accel2 * dt, self.theta2_dot)
+        self.theta1 = np.where(active, self.theta1 + self.theta1_dot * dt, self.theta1)
+        self.theta2 = np.where(active, self.theta2 + self.theta2_dot * dt, self.theta2)
+        self.t += dt
+
+        hit = active & ~self.collided & check_platform_collisions(
+            self.theta1, self.theta2, self.pivot1_x, self.pivot_y, self.pivot2_x, self.pivot_y
+        )
+        if hit.any():
+            self.impact_velocity1[hit] = self.theta1_dot[hit] * LENGTH_SWING
+            self.impact_velocity2[hit] = self.theta2_dot[hit] * LENGTH_SWING
+            self.theta1_dot[hit], self.theta2_dot[hit] = calculate_collision(
+                self.theta1_dot[hit], self.theta2_dot[hit], self.mass1_kg[hit], self.mass2_kg[hit], RESTITUTION_COEFF
+            )
+            self.collided |= hit
+        return np.flatnonzero(hit)
+
+    def results(self, index):
+        """Résultats du scénario `index` au format du panneau de résultats (après sa collision)."""
+        scenario = self.scenarios[index]
+        mass1_kg, mass2_kg = float(self.mass1_kg[index]), float(self.mass2_kg[index])
+        results = dict(scenario)
+        results.update({
+            "mass1_kg": mass1_kg,
+            "mass2_kg": mass2_kg,
+            "angle_horizontal_1": math.degrees(self.theta1[index]),
+            "angle_horizontal_2": math.degrees(self.theta2[index]),
+        })
+        results.update(assess_impact(float(self.impact_velocity1[index]), float(self.impact_velocity2[index]),
+                                     mass1_kg, mass2_kg, scenario["age"], scenario["impact_type"]))
+        return results
+
+
+def run_batch(scenarios, dt=1.0 / 60.0, time_limit=10.0):
+    """
+    Simule les scénarios jusqu'à leur collision, sans rendu.
+
+    Returns:
+        list: Résultats de chaque scénario (voir SwingBatch.results), ou None si
+        aucune collision ne survient avant `time_limit` secondes.
+    """
+    batch = SwingBatch(scenarios)
+    results = [None] * len(batch)
+    while batch.t < time_limit and not batch.collided.all():
+        for index in batch.step(dt, ~batch.collided):
+            results[index] = batch.results(index)
+    return results
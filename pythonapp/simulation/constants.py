@@ -20,4 +20,10 @@ ANTHROPOMETRIC_DATA = {
 # Seuils de risque
 DECAPITATION_THRESHOLD = (5, 10)
 CERVICAL_FRACTURE_THRESHOLD = (3, 6)
-CONCUSSION_ACCELERATION_THRESHOLD = 80  # g (approx. 784 m/s²)
\ No newline at end of file
+CONCUSSION_ACCELERATION_THRESHOLD = 80  # g (approx. 784 m/s²)
+
+# Critère de blessure à la tête (HIC)
+HIC_THRESHOLD = 1000  # HIC maximal pour les chutes critiques (CSA Z614-20)
+HIC15_WINDOW_MS = 15
+HIC36_WINDOW_MS = 36
+HIC_SAMPLE_RATE_HZ = 10000  # Échantillonnage de l'impulsion d'accélération
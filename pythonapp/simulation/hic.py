@@ -0,0 +1,153 @@
+# simulation/hic.py
+import numpy as np
+
+from .constants import G, COLLISION_TIME, HIC15_WINDOW_MS, HIC36_WINDOW_MS, HIC_SAMPLE_RATE_HZ
+
+
+def generate_impact_pulse(mean_acceleration_ms2, duration_s=COLLISION_TIME, sample_rate_hz=HIC_SAMPLE_RATE_HZ):
+    """
+    Génère une impulsion d'accélération demi-sinusoïdale échantillonnée.
+
+    L'amplitude est choisie pour que l'accélération moyenne sur la durée du choc
+    corresponde à `mean_acceleration_ms2` (même impulsion que le modèle force = m·v / t).
+
+    Args:
+        mean_acceleration_ms2 (float | array_like): Accélération(s) moyenne(s) en m/s².
+            Un tableau de forme (k,) produit un lot de k impulsions.
+        duration_s (float): Durée du choc en secondes.
+        sample_rate_hz (float): Fréquence d'échantillonnage en Hz.
+
+    Returns:
+        tuple: (temps en s de forme (n,), accélérations en m/s² de forme (..., n)).
+
+    Raises:
+        ValueError: Si la durée ou la fréquence d'échantillonnage n'est pas positive.
+    """
+    if duration_s <= 0 or sample_rate_hz <= 0:
+        raise ValueError("La durée du choc et la fréquence d'échantillonnage doivent être supérieures à zéro.")
+    n_samples = max(int(round(duration_s * sample_rate_hz)), 1) + 1
+    times = np.linspace(0.0, duration_s, n_samples)
+    shape = np.sin(np.pi * times / duration_s)
+    peak = np.asarray(mean_acceleration_ms2, dtype=float) * (np.pi / 2)
+    return times, peak[..., np.newaxis] * shape
+
+
+def _window_hic(cumulative, starts, ends, dt):
+    """HIC des fenêtres [starts, ends] (indices d'échantillons) à partir de l'intégrale cumulée."""
+    duration = (ends - starts) * dt
+    mean_g = (cumulative[ends] - cumulative[starts]) / duration / G
+    return np.max(mean_g ** 2.5 * duration, initial=0.0)
+
+
+def _scan_hic(cumulative, max_width, dt):
+    """Balayage complet : toutes les fenêtres de 1 à `max_width` échantillons, O(n·w)."""
+    hic = np.zeros(cumulative.shape[:-1])
+    for width in range(1, max_width + 1):
+        duration = width * dt
+        mean_g = (cumulative[..., width:] - cumulative[..., :-width]) / duration / G
+        np.maximum(hic, np.max(mean_g ** 2.5, axis=-1) * duration, out=hic)
+    return hic
+
+
+def _unimodal_peak(accel):
+    """
+    Indice du pic si `accel` croît strictement puis décroît strictement, sinon None.
+
+    Un palier (échantillons égaux) ferait apparier une seule de ses extrémités
+    dans _unimodal_hic et pourrait sous-estimer le HIC : ces impulsions passent
+    par le balayage complet.
+    """
+    peak = int(np.argmax(accel))
+    if np.all(np.diff(accel[:peak + 1]) > 0) and np.all(np.diff(accel[peak:]) < 0):
+        return peak
+    return None
+
+
+def _unimodal_hic(accel, cumulative, peak, max_width, dt):
+    """
+    HIC d'une impulsion strictement unimodale en O(n) fenêtres candidates.
+
+    À l'optimum, soit la fenêtre touche un bord de l'impulsion, soit elle a la
+    largeur maximale, soit ses deux bornes ont la même accélération
+    (a(t1) = a(t2) = 0,6 x accélération moyenne). Sur une impulsion unimodale,
+    chaque borne du front montant n'a qu'une borne correspondante sur le front
+    descendant : on les apparie par recherche dichotomique, en gardant les deux
+    échantillons qui encadrent chaque correspondance.
+    """
+    n_samples = len(accel)
+    rising = np.arange(peak + 1)
+    falling = np.arange(peak, n_samples)
+    # Front descendant retourné (croissant) pour searchsorted
+    falling_up = accel[peak:][::-1]
+    # Pour chaque t1 montant : dernier t2 descendant avec a(t2) >= a(t1), et le suivant
+    matched_ends = n_samples - 1 - np.searchsorted(falling_up, accel[rising], side="left")
+    # Pour chaque t2 descendant : premier t1 montant avec a(t1) >= a(t2), et le précédent
+    matched_starts = np.searchsorted(accel[:peak + 1], accel[falling], side="left")
+    starts = np.concatenate([rising, rising, matched_starts, matched_starts - 1])
+    ends = np.concatenate([matched_ends, matched_ends + 1, falling, falling])
+
+    # Fenêtres de largeur maximale et fenêtres touchant un bord
+    widths = np.arange(1, max_width + 1)
+    slide = np.arange(n_samples - max_width)
+    starts = np.concatenate([starts, slide, np.zeros(max_width, dtype=int), n_samples - 1 - widths])
+    ends = np.concatenate([ends, slide + max_width, widths, np.full(max_width, n_samples - 1)])
+
+    valid = (starts >= 0) & (ends < n_samples) & (ends > starts) & (ends - starts <= max_width)
+    return _window_hic(cumulative, starts[valid], ends[valid], dt)
+
+
+def calculate_hic(acceleration_ms2, dt, max_window_ms=HIC15_WINDOW_MS):
+    """
+    Calcule le critère de blessure à la tête (HIC) d'une ou plusieurs impulsions.
+
+    HIC = max[(t2 - t1) · (1/(t2 - t1) ∫ a dt / g)^2.5] pour t2 - t1 ≤ fenêtre.
+    L'intégrale est tabulée une seule fois (somme cumulée trapézoïdale). Pour
+    une impulsion strictement unimodale (le cas des chocs simulés), seules O(n) fenêtres
+    candidates sont évaluées (voir _unimodal_hic) ; sinon toutes les fenêtres
+    sont balayées, en O(n·w) (w = échantillons par fenêtre).
+
+    Args:
+        acceleration_ms2 (array_like): Accélération résultante en m/s², de forme (n,)
+            ou (..., n) pour un lot d'impulsions échantillonnées au même pas.
+        dt (float): Pas d'échantillonnage en secondes.
+        max_window_ms (float): Largeur maximale de la fenêtre (15 pour HIC15, 36 pour HIC36).
+
+    Returns:
+        float | numpy.ndarray: HIC de chaque impulsion (float pour une impulsion unique).
+
+    Raises:
+        ValueError: Si le pas est nul ou si l'impulsion compte moins de deux échantillons.
+    """
+    if dt <= 0:
+        raise ValueError("Le pas d'échantillonnage doit être supérieur à zéro.")
+    accel = np.abs(np.asarray(acceleration_ms2, dtype=float))
+    n_samples = accel.shape[-1] if accel.ndim else 0
+    if n_samples < 2:
+        raise ValueError("L'impulsion doit compter au moins deux échantillons.")
+
+    increments = (accel[..., 1:] + accel[..., :-1]) * (dt / 2)
+    cumulative = np.concatenate([np.zeros(accel.shape[:-1] + (1,)), np.cumsum(increments, axis=-1)], axis=-1)
+
+    max_width = int(np.floor(max_window_ms / 1000 / dt + 1e-9))
+    max_width = min(max(max_width, 1), n_samples - 1)
+    pulses = accel.reshape(-1, n_samples)
+    cumulatives = cumulative.reshape(-1, n_samples)
+    hic = np.empty(len(pulses))
+    for index, (pulse, pulse_cumulative) in enumerate(zip(pulses, cumulatives)):
+        peak = _unimodal_peak(pulse)
+        if peak is None:
+            hic[index] = _scan_hic(pulse_cumulative, max_width, dt)
+        else:
+            hic[index] = _unimodal_hic(pulse, pulse_cumulative, peak, max_width, dt)
+    hic = hic.reshape(accel.shape[:-1])
+    return float(hic) if hic.ndim == 0 else hic
+
+
+def calculate_hic15(acceleration_ms2, dt):
+    """Calcule le HIC15 (fenêtre maximale de 15 ms)."""
+    return calculate_hic(acceleration_ms2, dt, HIC15_WINDOW_MS)
+
+
+def calculate_hic36(acceleration_ms2, dt):
+    """Calcule le HIC36 (fenêtre maximale de 36 ms)."""
+    return calculate_hic(acceleration_ms2, dt, HIC36_WINDOW_MS)
@@ -1,6 +1,7 @@
 # simulation/risk_assessment.py
 from .constants import (
-    ANTHROPOMETRIC_DATA, DECAPITATION_THRESHOLD, CERVICAL_FRACTURE_THRESHOLD, CONCUSSION_ACCELERATION_THRESHOLD
+    ANTHROPOMETRIC_DATA, DECAPITATION_THRESHOLD, CERVICAL_FRACTURE_THRESHOLD, CONCUSSION_ACCELERATION_THRESHOLD,
+    HIC_THRESHOLD
 )
 from .models import RiskLevel
 
@@ -44,4 +45,13 @@ def assess_concussion_risk(acceleration_ms2, age):
     elif acceleration_g < CONCUSSION_ACCELERATION_THRESHOLD:
         return RiskLevel.POSSIBLE
     else:
-        return RiskLevel.PROBABLE
\ No newline at end of file
+        return RiskLevel.PROBABLE
+
+
+def assess_hic_risk(hic):
+    if hic < HIC_THRESHOLD * 0.8:
+        return RiskLevel.IMPROBABLE
+    elif hic < HIC_THRESHOLD:
+        return RiskLevel.POSSIBLE
+    else:
+        return RiskLevel.PROBABLE
@@ -1,12 +1,22 @@
 # main.py
-import pygame
+import argparse
 from ui.interface import create_application
+from animation.resolution import DEFAULT_RESOLUTION, parse_resolution
 
 
 def main():
-    pygame.init()
-    create_application()
-    pygame.quit()
+    parser = argparse.ArgumentParser(description="Simulation de collisions de balançoires")
+    parser.add_argument("--out-of-process", action="store_true",
+                        help="exécuter le rendu dans un processus séparé (mémoire partagée)")
+    parser.add_argument("--resolution", type=parse_resolution, default=DEFAULT_RESOLUTION,
+                        help="résolution d'affichage de l'animation, ex. 1024x768 (défaut : 800x600)")
+    parser.add_argument("--dynamic-resolution", action="store_true",
+                        help="réduire la résolution de rendu pour tenir la cadence cible")
+    parser.add_argument("--target-fps", type=float, default=60,
+                        help="cadence visée par la résolution dynamique (défaut : 60)")
+    args = parser.parse_args()
+    create_application(out_of_process=args.out_of_process, resolution=args.resolution,
+                       dynamic_resolution=args.dynamic_resolution, target_fps=args.target_fps)
 
 
 if __name__ == "__main__":
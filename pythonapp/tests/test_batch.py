@@ -0,0 +1,62 @@
+# tests/test_batch.py
+import math
+
+import numpy as np
+import pytest
+
+from simulation.batch import SwingBatch, DAMPING_COEFF, RESTITUTION_COEFF
+from simulation.calculations import calculate_max_angle, calculate_collision, check_platform_collision
+from simulation.constants import G, LENGTH_SWING, LBS_TO_KG
+
+SCENARIOS = [
+    dict(age=age, max_height=height, mass1_lbs=mass1, mass2_lbs=100, v_init1=v_init, v_init2=0, impact_type="frontal")
+    for age, height, mass1, v_init in ((1, 1.0, 100, 0), (3, 1.2, 60, 0.5), (5, 1.5, 150, 1.0))
+]
+
+
+def single_scenario(scenario, dt, steps):
+    """Même intégration et même collision que animate_swings, pour un seul scénario."""
+    mass1_kg, mass2_kg = scenario["mass1_lbs"] * LBS_TO_KG, scenario["mass2_lbs"] * LBS_TO_KG
+    max_angle_rad = math.radians(calculate_max_angle(scenario["max_height"]))
+    theta1, theta2 = -max_angle_rad, max_angle_rad
+    theta1_dot = scenario["v_init1"] / LENGTH_SWING
+    theta2_dot = -scenario["v_init2"] / LENGTH_SWING
+    collided = False
+    for _ in range(steps):
+        theta1_dot += (-(G / LENGTH_SWING) * math.sin(theta1) - (DAMPING_COEFF / mass1_kg) * theta1_dot) * dt
+        theta2_dot += (-(G / LENGTH_SWING) * math.sin(theta2) - (DAMPING_COEFF / mass2_kg) * theta2_dot) * dt
+        theta1 += theta1_dot * dt
+        theta2 += theta2_dot * dt
+        if not collided and check_platform_collision(theta1, theta2, -2.0, LENGTH_SWING, 2.0, LENGTH_SWING,
+                                                     LENGTH_SWING):
+            theta1_dot, theta2_dot = calculate_collision(theta1_dot, theta2_dot, mass1_kg, mass2_kg,
+                                                         RESTITUTION_COEFF)
+            collided = True
+    return theta1, theta2, theta1_dot, theta2_dot, collided
+
+
+def test_batch_matches_single_scenario_after_collision():
+    dt, steps = 1.0 / 60.0, 240
+    batch = SwingBatch(SCENARIOS)
+    for _ in range(steps):
+        batch.step(dt, ~np.zeros(len(batch), dtype=bool))
+    assert batch.collided.all()
+    for index, scenario in enumerate(SCENARIOS):
+        theta1, theta2, theta1_dot, theta2_dot, collided = single_scenario(scenario, dt, steps)
+        assert collided
+        assert batch.theta1[index] == pytest.approx(theta1, rel=1e-9, abs=1e-12)
+        assert batch.theta2[index] == pytest.approx(theta2, rel=1e-9, abs=1e-12)
+        assert batch.theta1_dot[index] == pytest.approx(theta1_dot, rel=1e-9, abs=1e-12)
+        assert batch.theta2_dot[index] == pytest.approx(theta2_dot, rel=1e-9, abs=1e-12)
+
+
+def test_collision_uses_calculate_collision():
+    batch = SwingBatch(SCENARIOS)
+    hits = []
+    while not len(hits):
+        hits = batch.step(1.0 / 60.0)
+    index = hits[0]
+    expected = calculate_collision(batch.impact_velocity1[index] / LENGTH_SWING,
+                                   batch.impact_velocity2[index] / LENGTH_SWING,
+                                   batch.mass1_kg[index], batch.mass2_kg[index], RESTITUTION_COEFF)
+    assert (batch.theta1_dot[index], batch.theta2_dot[index]) == pytest.approx(expected)
@@ -0,0 +1,96 @@
+# tests/test_hic.py
+import numpy as np
+import pytest
+
+from simulation.constants import G
+from simulation.hic import calculate_hic, generate_impact_pulse, _unimodal_peak
+
+WINDOWS_MS = (3, 15, 36)
+
+
+def brute_force_hic(acceleration_ms2, dt, max_window_ms):
+    """HIC de référence : toutes les paires (t1, t2) de largeur au plus la fenêtre, une par une."""
+    accel = np.abs(np.asarray(acceleration_ms2, dtype=float))
+    cumulative = np.concatenate([[0.0], np.cumsum((accel[1:] + accel[:-1]) * dt / 2)])
+    max_width = min(max(int(np.floor(max_window_ms / 1000 / dt + 1e-9)), 1), len(accel) - 1)
+    best = 0.0
+    for start in range(len(accel)):
+        for end in range(start + 1, min(start + max_width, len(accel) - 1) + 1):
+            duration = (end - start) * dt
+            mean_g = (cumulative[end] - cumulative[start]) / duration / G
+            best = max(best, duration * mean_g ** 2.5)
+    return best
+
+
+def strict_unimodal_pulse(rng, n_samples):
+    peak = rng.integers(0, n_samples)
+    rising = np.sort(rng.choice(np.arange(1, 10000), peak + 1, replace=False))
+    falling = np.sort(rng.choice(np.arange(1, rising[-1]), n_samples - peak - 1, replace=False))[::-1]
+    return np.concatenate([rising, falling]).astype(float)
+
+
+def plateau_pulse(rng, n_samples):
+    """Impulsion unimodale au sens large : valeurs entières peu nombreuses, donc des paliers."""
+    peak = rng.integers(0, n_samples)
+    rising = np.sort(rng.integers(0, 20, peak + 1))
+    falling = np.sort(rng.integers(0, rising[-1] + 1, n_samples - peak - 1))[::-1]
+    return np.concatenate([rising, falling]).astype(float) * 100
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_strict_unimodal_pulse_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    pulse = strict_unimodal_pulse(rng, int(rng.integers(3, 80)))
+    assert _unimodal_peak(pulse) is not None
+    for window_ms in WINDOWS_MS:
+        assert calculate_hic(pulse, 1e-3, window_ms) == pytest.approx(brute_force_hic(pulse, 1e-3, window_ms),
+                                                                      rel=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_plateau_pulse_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    pulse = plateau_pulse(rng, int(rng.integers(3, 80)))
+    for window_ms in WINDOWS_MS:
+        assert calculate_hic(pulse, 1e-3, window_ms) == pytest.approx(brute_force_hic(pulse, 1e-3, window_ms),
+                                                                      rel=1e-12)
+
+
+def test_plateau_regression():
+    # Paliers sur les deux fronts : n'apparier que leur premier échantillon donnait 289.9 au lieu de 300.3
+    pulse = np.array([2, 3, 3, 10, 10, 9, 8, 3, 3, 2, 1], dtype=float) * 100
+    assert _unimodal_peak(pulse) is None
+    assert calculate_hic(pulse, 1e-3, 15) == pytest.approx(brute_force_hic(pulse, 1e-3, 15), rel=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_non_unimodal_pulse_uses_full_scan(seed):
+    rng = np.random.default_rng(seed)
+    pulse = rng.uniform(0, 1000, int(rng.integers(3, 80)))
+    for window_ms in WINDOWS_MS:
+        assert calculate_hic(pulse, 1e-3, window_ms) == pytest.approx(brute_force_hic(pulse, 1e-3, window_ms),
+                                                                      rel=1e-12)
+
+
+def test_batch_matches_each_pulse():
+    rng = np.random.default_rng(0)
+    pulses = np.stack([strict_unimodal_pulse(rng, 40), plateau_pulse(rng, 40), rng.uniform(0, 1000, 40)])
+    hic = calculate_hic(pulses, 1e-3, 15)
+    assert hic.shape == (3,)
+    for pulse, value in zip(pulses, hic):
+        assert value == pytest.approx(brute_force_hic(pulse, 1e-3, 15), rel=1e-12)
+
+
+def test_generated_pulse_matches_brute_force():
+    times, pulses = generate_impact_pulse(np.array([500.0, 2000.0]), sample_rate_hz=2000)
+    dt = times[1] - times[0]
+    assert _unimodal_peak(pulses[0]) is not None
+    for pulse, value in zip(pulses, calculate_hic(pulses, dt, 36)):
+        assert value == pytest.approx(brute_force_hic(pulse, dt, 36), rel=1e-12)
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        calculate_hic([1.0, 2.0], 0.0)
+    with pytest.raises(ValueError):
+        calculate_hic([1.0], 1e-3)
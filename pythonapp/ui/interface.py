@@ -1,27 +1,59 @@
 # ui/interface.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-from PIL import Image, ImageTk
-import pygame
 from simulation.calculations import (
     calculate_max_angle
 )
-from simulation.constants import LBS_TO_KG, LENGTH_SWING, ANTHROPOMETRIC_DATA
-from animation.animation import animate_swings_thread
+from simulation.constants import LENGTH_SWING, ANTHROPOMETRIC_DATA
+from animation.resolution import DEFAULT_RESOLUTION
+from animation.layout import MAX_COMPARISON_TILES
 
 
 class SwingSimulationApp:
-    def __init__(self, root):
+    def __init__(self, root, out_of_process=False, resolution=DEFAULT_RESOLUTION,
+                 dynamic_resolution=False, target_fps=60):
         self.root = root
         self.root.title("Simulation de collisions de balançoires")
         self.root.geometry("1200x800")
-        self.is_running = tk.BooleanVar(value=False)
         self.max_angle = 0
         self.force = 0
         self.velocity1_global = 0
         self.velocity2_global = 0
+        self.resolution = resolution
+        self.render_options = (out_of_process, dynamic_resolution, target_fps)
+        self.render_worker = None
+        self.frame_presenter = None
+        self.live_plots = None
+        self._run_frame_stats = None
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Le moteur de rendu (PIL, pygame, PyOpenGL) n'est chargé qu'une fois la fenêtre affichée
+        self.root.bind("<Map>", self._on_map, add="+")
+
+    def _on_map(self, event):
+        if event.widget is self.root and self.render_worker is None:
+            self.root.after_idle(self.start_renderer)
+
+    def start_renderer(self):
+        """Crée et démarre le moteur de rendu et le scrutateur d'images, si ce n'est déjà fait."""
+        if self.render_worker is not None:
+            return
+        from animation.render_worker import RenderWorker, RenderProcess
+        from animation.frame_pipeline import TkFramePresenter
+        from ui.live_plots import LivePlotPanel
+
+        out_of_process, dynamic_resolution, target_fps = self.render_options
+        worker_class = RenderProcess if out_of_process else RenderWorker
+        self.render_worker = worker_class(self.resolution, dynamic_resolution, target_fps)
+        self.live_plots = LivePlotPanel(self.plot_frame)
+        self.frame_presenter = TkFramePresenter(
+            self.root, self.animation_label, self.render_worker.mailbox, self.render_worker.events,
+            {"results": self.update_results, "comparison_results": self.update_comparison_results,
+             "samples": self.live_plots.extend, "finished": self.on_animation_finished},
+            display_size=self.resolution
+        )
+        self.render_worker.start()
+        self.frame_presenter.start()
 
     def setup_ui(self):
         style = ttk.Style()
@@ -90,13 +122,40 @@ class SwingSimulationApp:
         impact_radio2 = ttk.Radiobutton(input_frame, text="Concentré (bord étroit)", variable=self.impact_var, value="concentré")
         impact_radio2.pack(anchor="w", padx=5)
 
+        # Comparison section
+        compare_title = ttk.Label(input_frame, text="Comparaison de scénarios", style="Title.TLabel")
+        compare_title.pack(pady=(10, 5))
+        compare_ages_label = ttk.Label(input_frame, text="Âges à comparer (ex. 1,2,3) :")
+        compare_ages_label.pack(anchor="w", padx=5)
+        self.compare_ages_entry = ttk.Entry(input_frame, width=20)
+        self.compare_ages_entry.pack(anchor="w", padx=5, pady=2)
+        self.compare_ages_entry.insert(0, "1,2,3,4,5")
+        compare_heights_label = ttk.Label(input_frame, text="Hauteurs à comparer (m, vide = hauteur ci-dessus) :")
+        compare_heights_label.pack(anchor="w", padx=5)
+        self.compare_heights_entry = ttk.Entry(input_frame, width=20)
+        self.compare_heights_entry.pack(anchor="w", padx=5, pady=2)
+        self.compare_impact_vars = {
+            "frontal": tk.BooleanVar(value=True),
+            "concentré": tk.BooleanVar(value=True),
+        }
+        compare_check1 = ttk.Checkbutton(input_frame, text="Frontal", variable=self.compare_impact_vars["frontal"])
+        compare_check1.pack(anchor="w", padx=5)
+        compare_check2 = ttk.Checkbutton(input_frame, text="Concentré (bord étroit)",
+                                         variable=self.compare_impact_vars["concentré"])
+        compare_check2.pack(anchor="w", padx=5)
+
         # Result section
         result_frame = ttk.Frame(left_frame)
         result_frame.pack(fill="x", padx=5, pady=5)
         result_title = ttk.Label(result_frame, text="Résultats de la simulation", style="Title.TLabel")
         result_title.pack()
-        self.result_text = tk.Text(result_frame, height=20, width=55, font=("Arial", 10))
-        self.result_text.pack(pady=5)
+        self.result_notebook = ttk.Notebook(result_frame)
+        self.result_notebook.pack(fill="both", expand=True, pady=5)
+        self.result_text = tk.Text(self.result_notebook, height=20, width=55, font=("Arial", 10))
+        self.result_notebook.add(self.result_text, text="Résultats")
+        # Courbes en direct : le panneau (et NumPy) est créé avec le moteur de rendu
+        self.plot_frame = ttk.Frame(self.result_notebook)
+        self.result_notebook.add(self.plot_frame, text="Courbes")
 
         # Right panel: Animation
         animation_frame = ttk.Frame(main_frame, relief="ridge", borderwidth=2)
@@ -109,13 +168,14 @@ class SwingSimulationApp:
         control_frame.pack(fill="x", pady=5)
         self.toggle_button = ttk.Button(control_frame, text="Démarrer", command=self.toggle_animation)
         self.toggle_button.pack(side="left", padx=5)
+        self.compare_button = ttk.Button(control_frame, text="Comparer", command=self.start_comparison)
+        self.compare_button.pack(side="left", padx=5)
 
-        self.animation_surface = pygame.Surface((800, 600))
-        self.animation_surface.fill((200, 200, 200))
         self.animation_label = ttk.Label(animation_frame)
         self.animation_label.pack(pady=5)
-        initial_image = Image.frombytes("RGB", (800, 600), pygame.image.tostring(self.animation_surface, "RGB"))
-        initial_photo = ImageTk.PhotoImage(initial_image)
+        width, height = self.resolution
+        initial_photo = tk.PhotoImage(width=width, height=height)
+        initial_photo.put("#c8c8c8", to=(0, 0, width, height))
         self.animation_label.configure(image=initial_photo)
         self.animation_label.image = initial_photo
 
@@ -140,47 +200,136 @@ class SwingSimulationApp:
         self.result_text.insert(tk.END, f"Probabilité de décapitation partielle : {results['decapitation_risk']}\n")
         self.result_text.insert(tk.END, f"Probabilité de fracture cervicale : {results['cervical_fracture_risk']}\n")
         self.result_text.insert(tk.END, f"Probabilité de commotion cérébrale : {results['concussion_risk']}\n")
+        self.result_text.insert(tk.END, f"HIC15 : {results['hic15']:.1f} (HIC36 : {results['hic36']:.1f})\n")
+        self.result_text.insert(tk.END, f"Probabilité de blessure à la tête (HIC) : {results['hic_risk']}\n")
+
+    def read_parameters(self):
+        """Lit et valide les paramètres saisis ; affiche une erreur et retourne None s'ils sont invalides."""
+        try:
+            params = {
+                "age": int(self.age_var.get()),
+                "mass1_lbs": float(self.mass1_entry.get()),
+                "mass2_lbs": float(self.mass2_entry.get()),
+                "v_init1": float(self.v_init1_entry.get()),
+                "v_init2": float(self.v_init2_entry.get()),
+                "max_height": float(self.height_entry.get()),
+                "impact_type": self.impact_var.get(),
+            }
+        except ValueError:
+            messagebox.showerror("Erreur", "Valeurs invalides pour les paramètres.")
+            return None
+        if not self.check_height(params["max_height"]):
+            return None
+        if params["mass1_lbs"] <= 0 or params["mass2_lbs"] <= 0:
+            messagebox.showerror("Erreur", "La masse des balançoires doit être supérieure à 0.")
+            return None
+        if params["v_init1"] < 0 or params["v_init2"] < 0:
+            messagebox.showerror("Erreur", "Les vitesses initiales ne peuvent pas être négatives.")
+            return None
+        return params
+
+    def check_height(self, max_height):
+        if max_height <= 0:
+            messagebox.showerror("Erreur", "La hauteur doit être > 0.")
+            return False
+        if max_height > LENGTH_SWING:
+            messagebox.showerror("Erreur", f"La hauteur d'oscillation ne peut pas dépasser la longueur de la balançoire ({LENGTH_SWING} m).")
+            return False
+        return True
 
     def toggle_animation(self):
-        if self.is_running.get():
-            self.is_running.set(False)
+        self.start_renderer()
+        if self.render_worker.running.is_set():
+            self.render_worker.stop()
             self.toggle_button.configure(text="Démarrer")
+            self.report_frame_stats()
         else:
-            try:
-                age = int(self.age_var.get())
-                mass1_lbs = float(self.mass1_entry.get())
-                mass2_lbs = float(self.mass2_entry.get())
-                v_init1 = float(self.v_init1_entry.get())
-                v_init2 = float(self.v_init2_entry.get())
-                max_height = float(self.height_entry.get())
-                impact_type = self.impact_var.get()
-                if max_height <= 0:
-                    messagebox.showerror("Erreur", "La hauteur doit être > 0.")
-                    return
-                if max_height > LENGTH_SWING:
-                    messagebox.showerror("Erreur", f"La hauteur d'oscillation ne peut pas dépasser la longueur de la balançoire ({LENGTH_SWING} m).")
-                    return
-                if mass1_lbs <= 0 or mass2_lbs <= 0:
-                    messagebox.showerror("Erreur", "La masse des balançoires doit être supérieure à 0.")
-                    return
-                if v_init1 < 0 or v_init2 < 0:
-                    messagebox.showerror("Erreur", "Les vitesses initiales ne peuvent pas être négatives.")
-                    return
-                self.max_angle = calculate_max_angle(max_height)
-                self.is_running.set(True)
-                self.toggle_button.configure(text="Stop")
-                threading.Thread(
-                    target=animate_swings_thread,
-                    args=(self.animation_surface, self.animation_label, self.root, self.toggle_button, self.is_running,
-                          self.update_results, self.max_angle, age, mass1_lbs, mass2_lbs,
-                          v_init1, v_init2, max_height, impact_type),
-                    daemon=True
-                ).start()
-            except ValueError:
-                messagebox.showerror("Erreur", "Valeurs invalides pour les paramètres.")
-
-
-def create_application():
+            params = self.read_parameters()
+            if params is None:
+                return
+            self.max_angle = calculate_max_angle(params["max_height"])
+            self.toggle_button.configure(text="Stop")
+            self.live_plots.clear()
+            self._run_frame_stats = self.render_worker.mailbox.stats()
+            self.render_worker.submit(self.max_angle, params["age"], params["mass1_lbs"], params["mass2_lbs"],
+                                      params["v_init1"], params["v_init2"], params["max_height"],
+                                      params["impact_type"])
+
+    def start_comparison(self):
+        """Lance l'animation côte à côte de toutes les combinaisons âges x hauteurs x types d'impact."""
+        self.start_renderer()
+        if self.render_worker.running.is_set():
+            return
+        params = self.read_parameters()
+        if params is None:
+            return
+        try:
+            ages = [int(value) for value in self.compare_ages_entry.get().split(",") if value.strip()]
+            heights = [float(value) for value in self.compare_heights_entry.get().split(",") if value.strip()]
+        except ValueError:
+            messagebox.showerror("Erreur", "Listes de comparaison invalides (valeurs séparées par des virgules).")
+            return
+        ages = ages or [params["age"]]
+        heights = heights or [params["max_height"]]
+        impact_types = [impact_type for impact_type, var in self.compare_impact_vars.items() if var.get()]
+        impact_types = impact_types or [params["impact_type"]]
+        if any(age not in ANTHROPOMETRIC_DATA for age in ages):
+            messagebox.showerror("Erreur", "Les âges comparés doivent être compris entre 1 et 5 ans.")
+            return
+        if not all(self.check_height(height) for height in heights):
+            return
+        scenarios = [
+            dict(params, age=age, max_height=height, impact_type=impact_type)
+            for age in ages for height in heights for impact_type in impact_types
+        ]
+        if len(scenarios) > MAX_COMPARISON_TILES:
+            messagebox.showerror("Erreur", f"Trop de scénarios ({len(scenarios)}) : {MAX_COMPARISON_TILES} au maximum.")
+            return
+        self.result_text.delete(1.0, tk.END)
+        self.toggle_button.configure(text="Stop")
+        self._run_frame_stats = self.render_worker.mailbox.stats()
+        self.render_worker.submit_comparison(scenarios)
+
+    def update_comparison_results(self, results_list):
+        """Affiche une ligne de résultats par tuile de la comparaison."""
+        self.result_text.delete(1.0, tk.END)
+        for index, results in enumerate(results_list):
+            if results is None:
+                self.result_text.insert(tk.END, f"{index + 1}. (pas encore de collision)\n")
+                continue
+            self.result_text.insert(
+                tk.END,
+                f"{index + 1}. {results['age']} ans, {results['impact_type']}, {results['max_height']:.2f} m : "
+                f"{results['relative_velocity']:.2f} m/s, {results['force']:.0f} N, "
+                f"{results['pressure_mpa']:.2f} MPa, HIC15 {results['hic15']:.0f}\n"
+                f"    Décapitation : {results['decapitation_risk']}, fracture : {results['cervical_fracture_risk']}, "
+                f"commotion : {results['concussion_risk']}, HIC : {results['hic_risk']}\n"
+            )
+
+    def on_animation_finished(self, _payload):
+        self.toggle_button.configure(text="Démarrer", state="normal")
+        self.report_frame_stats()
+
+    def report_frame_stats(self):
+        """Affiche le nombre d'images affichées et abandonnées pendant l'animation qui se termine."""
+        if self._run_frame_stats is None:
+            return
+        stats = self.render_worker.mailbox.stats()
+        displayed = stats["displayed"] - self._run_frame_stats["displayed"]
+        dropped = stats["dropped"] - self._run_frame_stats["dropped"]
+        self._run_frame_stats = None
+        print(f"Images affichées : {displayed}, abandonnées : {dropped}")
+
+    def on_close(self):
+        if self.render_worker is not None:
+            self.frame_presenter.stop()
+            self.render_worker.shutdown()
+        self.root.destroy()
+
+
+def create_application(out_of_process=False, resolution=DEFAULT_RESOLUTION, dynamic_resolution=False,
+                       target_fps=60):
     root = tk.Tk()
-    app = SwingSimulationApp(root)
+    app = SwingSimulationApp(root, out_of_process=out_of_process, resolution=resolution,
+                             dynamic_resolution=dynamic_resolution, target_fps=target_fps)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,159 @@
+# ui/live_plots.py
+import tkinter as tk
+
+import numpy as np
+
+# Colonnes des échantillons envoyés par le rendu : (t, Ec, Ep, ω1, ω2, force)
+SAMPLE_COLUMNS = ("t", "kinetic_energy", "potential_energy", "omega1", "omega2", "force")
+
+# (titre, [(colonne, légende, couleur), ...])
+PLOTS = (
+    ("Énergie (J)", ((1, "Cinétique", "#d62728"), (2, "Potentielle", "#1f77b4"))),
+    ("Vitesse angulaire (rad/s)", ((3, "Balançoire 1", "#1f77b4"), (4, "Balançoire 2", "#d62728"))),
+    ("Force d'impact (N)", ((5, "Force", "#ff7f0e"),)),
+)
+
+
+class SampleRing:
+    """Tampon circulaire de taille fixe pour des échantillons à plusieurs colonnes."""
+
+    def __init__(self, capacity, columns):
+        self._data = np.zeros((capacity, columns))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+
+    def extend(self, rows):
+        """Ajoute des lignes ; les plus anciennes sont écrasées une fois la capacité atteinte."""
+        rows = np.asarray(rows, dtype=float).reshape(-1, self._data.shape[1])
+        capacity = len(self._data)
+        if len(rows) >= capacity:
+            self._data[:] = rows[-capacity:]
+            self._start, self._size = 0, capacity
+            return
+        end = (self._start + self._size) % capacity
+        first = min(len(rows), capacity - end)
+        self._data[end:end + first] = rows[:first]
+        self._data[:len(rows) - first] = rows[first:]
+        overflow = max(self._size + len(rows) - capacity, 0)
+        self._start = (self._start + overflow) % capacity
+        self._size = min(self._size + len(rows), capacity)
+
+    def view(self):
+        """Retourne les échantillons dans l'ordre chronologique (copie si le tampon a bouclé)."""
+        end = self._start + self._size
+        if end <= len(self._data):
+            return self._data[self._start:end]
+        return np.concatenate((self._data[self._start:], self._data[:end - len(self._data)]))
+
+
+def minmax_decimate(x, y, buckets):
+    """
+    Réduit une série à au plus 2 x `buckets` points en gardant le minimum et le
+    maximum de chaque tranche : les pics (ex. la force d'impact) restent visibles
+    et le coût du tracé ne dépend plus de la durée de la simulation.
+
+    Args:
+        x (numpy.ndarray): Abscisses croissantes, de forme (n,).
+        y (numpy.ndarray): Ordonnées, de forme (n,) ou (n, k) pour k séries.
+        buckets (int): Nombre de tranches (typiquement la largeur du tracé en pixels).
+
+    Returns:
+        tuple: (x, y) décimés, avec pour chaque tranche son minimum puis son maximum.
+    """
+    if len(x) <= 2 * buckets:
+        return x, y
+    starts = np.linspace(0, len(x), buckets, endpoint=False).astype(int)
+    lows = np.minimum.reduceat(y, starts, axis=0)
+    highs = np.maximum.reduceat(y, starts, axis=0)
+    return np.repeat(x[starts], 2), np.stack((lows, highs), axis=1).reshape((2 * buckets,) + y.shape[1:])
+
+
+class LivePlotPanel:
+    """
+    Courbes en direct (énergies, vitesses angulaires, force d'impact) sur un Canvas Tk.
+
+    Les échantillons sont ajoutés à un SampleRing (ajout peu coûteux, à la
+    cadence des événements du rendu) ; le redessin est cadencé séparément
+    toutes les `redraw_interval_ms`, seulement s'il y a du nouveau et si le
+    panneau est visible. Chaque courbe est décimée min/max à la largeur du
+    tracé et les éléments du Canvas sont réutilisés d'un redessin à l'autre.
+    """
+
+    _left = 48  # Marge gauche réservée aux graduations, en pixels
+
+    def __init__(self, parent, width=400, plot_height=130, capacity=3600, redraw_interval_ms=200):
+        self.canvas = tk.Canvas(parent, width=width, height=plot_height * len(PLOTS), background="white",
+                                highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.width = width
+        self.plot_height = plot_height
+        self.redraw_interval_ms = redraw_interval_ms
+        self.samples = SampleRing(capacity, len(SAMPLE_COLUMNS))
+        self._dirty = False
+        self._plots = []
+        for index, (title, series) in enumerate(PLOTS):
+            top = index * plot_height
+            self.canvas.create_text(8, top + 4, anchor="nw", text=title, font=("Arial", 9, "bold"))
+            self.canvas.create_rectangle(self._left, top + 20, width - 8, top + plot_height - 6, outline="#bbbbbb")
+            y_max = self.canvas.create_text(self._left - 4, top + 20, anchor="ne", font=("Arial", 8))
+            y_min = self.canvas.create_text(self._left - 4, top + plot_height - 6, anchor="se", font=("Arial", 8))
+            lines = []
+            for position, (column, label, color) in enumerate(series):
+                legend = self.canvas.create_text(width - 10 - 110 * position, top + 4, anchor="ne",
+                                                 text=label, fill=color, font=("Arial", 8))
+                line = self.canvas.create_line(0, 0, 0, 0, fill=color, width=1.5, state="hidden")
+                lines.append((column, line, legend, label))
+            self._plots.append((top, y_min, y_max, lines))
+        self._after_id = self.canvas.after(self.redraw_interval_ms, self._tick)
+
+    def extend(self, rows):
+        """Ajoute des échantillons (t, Ec, Ep, ω1, ω2, force) ; le tracé suivra au prochain redessin."""
+        self.samples.extend(rows)
+        self._dirty = True
+
+    def clear(self):
+        self.samples.clear()
+        self._dirty = True
+
+    def _tick(self):
+        if self._dirty and self.canvas.winfo_ismapped():
+            self._dirty = False
+            self.redraw()
+        self._after_id = self.canvas.after(self.redraw_interval_ms, self._tick)
+
+    def redraw(self):
+        data = self.samples.view()
+        plot_width = self.width - 8 - self._left
+        for top, y_min_item, y_max_item, lines in self._plots:
+            if len(data) < 2:
+                for _column, line, _legend, _label in lines:
+                    self.canvas.itemconfigure(line, state="hidden")
+                self.canvas.itemconfigure(y_min_item, text="")
+                self.canvas.itemconfigure(y_max_item, text="")
+                continue
+            columns = [column for column, _line, _legend, _label in lines]
+            x, y = minmax_decimate(data[:, 0], data[:, columns], plot_width)
+            low, high = float(y.min()), float(y.max())
+            if high - low < 1e-9:
+                low, high = low - 1.0, high + 1.0
+            t0, t1 = float(x[0]), float(x[-1])
+            px = self._left + (x - t0) / max(t1 - t0, 1e-9) * plot_width
+            bottom, height = top + self.plot_height - 6, self.plot_height - 26
+            for position, (column, line, legend, label) in enumerate(lines):
+                py = bottom - (y[:, position] - low) / (high - low) * height
+                self.canvas.coords(line, *np.column_stack((px, py)).ravel().tolist())
+                self.canvas.itemconfigure(line, state="normal")
+                self.canvas.itemconfigure(legend, text=f"{label} : {data[-1, column]:.2f}")
+            self.canvas.itemconfigure(y_min_item, text=f"{low:.3g}")
+            self.canvas.itemconfigure(y_max_item, text=f"{high:.3g}")
+
+    def destroy(self):
+        self.canvas.after_cancel(self._after_id)
+        self.canvas.destroy()